@@ -71,16 +71,28 @@ def run_pipeline():
     base_filename = os.path.splitext(os.path.basename(names_replaced_file))[0]
     processor.filename_base = os.path.join(dict_output_dir, base_filename)
     
-    # Load CSV
-    if processor.load_csv():
+    # Read the header first, so only the needed columns are parsed
+    columns = processor.read_columns()
+    
+    if columns is not None:
         # Find t-columns
-        t_columns = [col for col in processor.data.columns 
+        t_columns = [col for col in columns 
                     if col.startswith('t') and col not in ['path_id', 'isnad_id']]
         
-        if t_columns:
+        # Large files are streamed in chunks; smaller ones are loaded into memory
+        stream = processor.is_large_file()
+        id_columns = [col for col in ['path_id', 'isnad_id'] if col in columns]
+        
+        if t_columns and not stream and not processor.load_csv(columns_of_interest=id_columns + t_columns):
+            logger.error(f"Failed to load {names_replaced_file}")
+        elif t_columns:
             # Create dictionaries
-            unique_file = processor.create_unique_values_dict(t_columns)
-            annotate_file = processor.create_annotation_dict(t_columns)
+            if stream:
+                unique_file = processor.stream_unique_values_dict(t_columns)
+                annotate_file = processor.stream_annotation_dict(t_columns)
+            else:
+                unique_file = processor.create_unique_values_dict(t_columns)
+                annotate_file = processor.create_annotation_dict(t_columns)
             
             if unique_file or annotate_file:
                 logger.info("Dictionary creation successful")
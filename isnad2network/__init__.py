@@ -48,5 +48,4 @@ __all__ = [
     'CSVDictionaryProcessor',
     'generate_network_data',
     'process_pipeline',
-    'isnad2network_cli',
-]
\ No newline at end of file
+]
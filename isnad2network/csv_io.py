@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+CSV reading and column helpers shared by the pipeline steps.
+
+The parser engine is selected with the ISNAD2NET_CSV_ENGINE environment
+variable: "c" (the default) or "pyarrow" for multi-threaded parsing.
+"""
+
+import os
+from functools import lru_cache
+
+import pandas as pd
+
+DEFAULT_ENGINE = "c"
+
+
+def read_csv(path, t_columns=None, **kwargs):
+    """
+    Read a CSV file with the configured pandas parser engine.
+
+    Falls back to the C engine if the PyArrow engine is requested but is not
+    installed or does not support the given options.
+
+    Args:
+        path (str): Path to the CSV file
+        t_columns (list): Name or transmission columns known to be in the file;
+            they are read as strings without type inference
+        **kwargs: Further arguments for pd.read_csv
+
+    Returns:
+        DataFrame: The loaded data
+    """
+    if t_columns:
+        kwargs['dtype'] = {**{col: str for col in t_columns}, **(kwargs.get('dtype') or {})}
+
+    engine = os.environ.get("ISNAD2NET_CSV_ENGINE", DEFAULT_ENGINE).lower()
+    if engine == "pyarrow":
+        try:
+            return pd.read_csv(path, engine="pyarrow", **kwargs)
+        except (ImportError, ValueError):
+            pass
+
+    return pd.read_csv(path, engine="c", low_memory=False, **kwargs)
+
+
+@lru_cache(maxsize=32)
+def _t_columns_cached(cols_tuple):
+    """Select the t-columns (t0, t-1, ...) from a tuple of column names."""
+    return tuple(col for col in cols_tuple
+                 if isinstance(col, str) and col.startswith('t') and col not in ('path_id', 'isnad_id'))
+
+
+def find_t_columns(df):
+    """
+    Get the t-columns (t0, t-1, ...) of a dataframe, in column order.
+
+    The selection is cached by column names, so the pipeline steps can look
+    up the t-columns of the same files repeatedly.
+
+    Args:
+        df (DataFrame): Names or transmission terms dataframe
+
+    Returns:
+        tuple: Column names
+    """
+    return _t_columns_cached(tuple(df.columns))
@@ -18,31 +18,140 @@ License: MIT
 import pandas as pd
 import numpy as np
 import os
-import re
 import time
 import logging
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
 from tqdm.auto import tqdm
 import io
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('csv_processing.log')
-    ]
-)
+# Shared CSV reader (relative import when used as part of the package)
+try:
+    from .csv_io import read_csv
+except ImportError:
+    from csv_io import read_csv
+
+# Library users configure logging themselves; main() calls configure_logging()
 logger = logging.getLogger('csv_processor')
+logger.addHandler(logging.NullHandler())
+
+# Input files larger than this many bytes are processed in chunks by main()
+STREAMING_THRESHOLD = 100 * 1024 * 1024
+
+# Minimum number of non-empty cells before words are counted in worker processes;
+# below this, starting the processes costs more than it saves
+PARALLEL_MIN_CELLS = 100_000
+
+
+def configure_logging(path='csv_processing.log', level=logging.INFO):
+    """
+    Log to the console and to a file.
+
+    Args:
+        path (str): Path of the log file, or None to only log to the console
+        level (int): Logging level
+    """
+    handlers = [logging.StreamHandler()]
+    if path:
+        handlers.append(logging.FileHandler(path))
+
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=handlers
+    )
+
+
+def _count_words(texts, weights):
+    """
+    Count the whitespace-separated words in a sequence of strings.
+
+    Defined at module level so it can be sent to worker processes.
+
+    Each string is split once and every resulting word contributes the weight
+    of the string it came from.
+
+    Args:
+        texts (list): Distinct cell values as strings
+        weights (list): Number of cells holding each value
+
+    Returns:
+        Series: Occurrences of each word, indexed by word
+    """
+    # One row per word, indexed by the position of the value it came from
+    words = pd.Series(texts, dtype=object).str.split().explode().dropna()
+    word_weights = np.asarray(weights, dtype=np.int64)[words.index.to_numpy(dtype=np.intp)]
+    return _sum_by_word(words.to_numpy(dtype=object), word_weights)
+
+
+def _sum_by_word(words, weights):
+    """
+    Add up the weights of identical words.
+
+    pd.factorize hashes the words into integer codes in a single pass, which
+    np.bincount then uses to sum the weights in C. Only the distinct words are
+    sorted afterwards, rather than every occurrence.
+
+    Args:
+        words (ndarray): Words as an object array
+        weights (ndarray): Weight of each word
+
+    Returns:
+        Series: Total weight of each distinct word, indexed by word (sorted)
+    """
+    codes, unique_words = pd.factorize(words)
+    totals = np.bincount(codes, weights=weights, minlength=len(unique_words))
+    order = np.argsort(unique_words)
+    return pd.Series(totals[order].astype(np.int64), index=unique_words[order])
+
+
+def _is_arrow_string(dtype):
+    """
+    Check whether a dtype keeps strings in Arrow buffers.
+
+    Args:
+        dtype: pandas dtype
+
+    Returns:
+        bool: True for string[pyarrow] (and the other Arrow storages of pd.StringDtype)
+            and for pd.ArrowDtype of an Arrow string type
+    """
+    if isinstance(dtype, pd.StringDtype):
+        return str(getattr(dtype, 'storage', '')).startswith('pyarrow')
+    return str(getattr(dtype, 'pyarrow_dtype', '')) in ('string', 'large_string')
+
 
 class CSVDictionaryProcessor:
     """Class to process CSV files and create dictionary outputs."""
 
-    def __init__(self):
-        """Initialize the processor."""
+    __slots__ = ('input_file', 'data', 'filename_base', 'fast_io', 'prefer_parquet',
+                 '_cleaned', '_unique_cache')
+
+    def __init__(self, fast_io=True, prefer_parquet=False):
+        """
+        Initialize the processor.
+
+        Args:
+            fast_io (bool): Whether to load CSV files with the multi-threaded PyArrow
+                reader into Arrow-backed columns (falls back to the pandas C engine
+                if PyArrow is not available)
+            prefer_parquet (bool): Whether to write a Parquet copy next to each output
+                CSV, and to load an up-to-date Parquet copy of the input file
+                (same path with a .parquet extension) instead of parsing the CSV;
+                a warning names the Parquet file when it is loaded instead
+        """
         self.input_file = None
         self.data = None
         self.filename_base = None
+        self.fast_io = fast_io
+        self.prefer_parquet = prefer_parquet
+
+        # Non-null values of each column as strings, and the distinct values with
+        # their number of occurrences, shared by both dictionaries (cleared by load_csv)
+        self._cleaned = {}
+        self._unique_cache = {}
 
     def upload_file(self):
         """
@@ -53,7 +162,7 @@ class CSVDictionaryProcessor:
         logger.info("When using as a module, set input_file directly.")
         return False
 
-    def load_csv(self, encoding='utf-8', sep=',', skip_display=False):
+    def load_csv(self, encoding='utf-8', sep=',', skip_display=False, columns_of_interest=None):
         """
         Load the CSV file and display a preview.
 
@@ -61,6 +170,7 @@ class CSVDictionaryProcessor:
             encoding (str): Character encoding of the file
             sep (str): Delimiter in the CSV file
             skip_display (bool): Whether to skip displaying the preview
+            columns_of_interest (list): Only read these columns (default: all columns)
 
         Returns:
             bool: True if loaded successfully, False otherwise
@@ -73,13 +183,16 @@ class CSVDictionaryProcessor:
             logger.info(f"Loading file: {self.input_file}")
             start_time = time.time()
 
+            self._cleaned = {}
+            self._unique_cache = {}
+
             # Try with specified encoding first
             try:
-                self.data = pd.read_csv(self.input_file, encoding=encoding, sep=sep)
+                self.data = self._read_csv(encoding=encoding, sep=sep, usecols=columns_of_interest)
             except UnicodeDecodeError:
                 # Try with utf-8-sig if utf-8 fails
                 logger.warning(f"Failed to decode with {encoding}, trying with utf-8-sig")
-                self.data = pd.read_csv(self.input_file, encoding='utf-8-sig', sep=sep)
+                self.data = self._read_csv(encoding='utf-8-sig', sep=sep, usecols=columns_of_interest)
 
             load_time = time.time() - start_time
             rows, cols = self.data.shape
@@ -102,6 +215,181 @@ class CSVDictionaryProcessor:
             logger.error(f"Error loading file: {str(e)}")
             return False
 
+    def _read_csv(self, encoding, sep, usecols=None):
+        """
+        Read the input file, using the PyArrow engine when fast_io is enabled.
+
+        String columns read by PyArrow are stored as string[pyarrow], which keeps
+        the text in Arrow buffers instead of one Python object per cell.
+
+        Args:
+            encoding (str): Character encoding of the file
+            sep (str): Delimiter in the CSV file
+            usecols (list): Columns to read, or None for all columns
+
+        Returns:
+            DataFrame: The loaded data
+        """
+        if usecols is not None:
+            usecols = list(usecols)
+
+        parquet_file = self._parquet_input()
+        if parquet_file:
+            if parquet_file == self.input_file:
+                logger.info(f"Reading Parquet file: {parquet_file}")
+            else:
+                logger.warning(f"Reading '{parquet_file}' instead of '{self.input_file}' (prefer_parquet is set)")
+            return pd.read_parquet(parquet_file, columns=usecols)
+
+        if self.fast_io:
+            try:
+                return pd.read_csv(self.input_file, encoding=encoding, sep=sep, usecols=usecols,
+                                   engine='pyarrow', dtype_backend='pyarrow')
+            except (ImportError, ValueError, TypeError) as e:
+                # PyArrow missing, pandas too old for dtype_backend, or a file the
+                # PyArrow parser rejects
+                logger.warning(f"PyArrow CSV reader unavailable ({e}), using the C engine")
+
+        t_columns = [col for col in usecols if str(col).startswith('t')] if usecols else None
+        return read_csv(self.input_file, t_columns=t_columns, encoding=encoding, sep=sep, usecols=usecols)
+
+    def _parquet_input(self):
+        """
+        Find a Parquet file to load instead of parsing the input CSV.
+
+        Returns:
+            str: The input file itself if it is a Parquet file, its Parquet copy if
+                prefer_parquet is set and the copy is at least as new as the CSV,
+                otherwise None
+        """
+        if self.input_file.endswith('.parquet'):
+            return self.input_file
+
+        if self.prefer_parquet:
+            parquet_file = os.path.splitext(self.input_file)[0] + '.parquet'
+            if (os.path.exists(parquet_file)
+                    and os.path.getmtime(parquet_file) >= os.path.getmtime(self.input_file)):
+                return parquet_file
+
+        return None
+
+    def read_columns(self, encoding='utf-8', sep=','):
+        """
+        Read only the header of the input file.
+
+        Args:
+            encoding (str): Character encoding of the file
+            sep (str): Delimiter in the CSV file
+
+        Returns:
+            list: Column names, or None if the header could not be read
+        """
+        if not self.input_file:
+            logger.error("No input file specified. Please set input_file first.")
+            return None
+
+        try:
+            if self.input_file.endswith('.parquet'):
+                import pyarrow.parquet as pq
+                return list(pq.read_schema(self.input_file).names)
+            return list(pd.read_csv(self.input_file, encoding=encoding, sep=sep, nrows=0).columns)
+        except Exception as e:
+            logger.error(f"Error reading header: {str(e)}")
+            return None
+
+    def is_large_file(self):
+        """
+        Check whether the input file should be processed in chunks.
+
+        Returns:
+            bool: True if the input file is a CSV larger than STREAMING_THRESHOLD bytes
+        """
+        if not self.input_file or self._parquet_input():
+            return False
+        return os.path.getsize(self.input_file) > STREAMING_THRESHOLD
+
+    def _read_chunks(self, columns, chunksize, encoding, sep):
+        """
+        Open the input file for chunked reading of the specified columns.
+
+        Args:
+            columns (list): List of column names to read
+            chunksize (int): Number of rows per chunk
+            encoding (str): Character encoding of the file
+            sep (str): Delimiter in the CSV file
+
+        Returns:
+            TextFileReader: Iterator over DataFrame chunks, or None if invalid
+        """
+        available_columns = self.read_columns(encoding=encoding, sep=sep)
+        if available_columns is None:
+            return None
+
+        # Validate columns
+        invalid_cols = [col for col in columns if col not in available_columns]
+        if invalid_cols:
+            logger.error(f"Invalid column(s): {', '.join(invalid_cols)}")
+            return None
+
+        return pd.read_csv(self.input_file, encoding=encoding, sep=sep, usecols=columns,
+                           dtype='string', chunksize=chunksize)
+
+    @staticmethod
+    def _annotation_frame(word_counts):
+        """
+        Build the annotation dictionary from word counts.
+
+        Args:
+            word_counts (Series): Occurrences of each word, indexed by word
+
+        Returns:
+            DataFrame: Words and counts (sorted by count, descending) with empty annotation columns
+        """
+        counts = word_counts.to_numpy()
+        order = np.argsort(-counts, kind='stable')
+        result_df = pd.DataFrame({
+            'unique_strings': word_counts.index.to_numpy(dtype=object)[order],
+            'count': counts[order]
+        })
+        result_df[['annotate_ar', 'annotate_kunyah', 'annotate_nasab', 'annotate_nisbah']] = ''
+        return result_df
+
+    def _save_dict(self, result_df, output_file, description):
+        """
+        Save a dictionary to CSV and download it when running in Google Colab.
+
+        Args:
+            result_df (DataFrame): The dictionary to save
+            output_file (str): Path to the output file
+            description (str): Name of the dictionary for log messages
+        """
+        try:
+            # PyArrow writes the CSV from Arrow buffers on multiple threads
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+            pacsv.write_csv(pa.Table.from_pandas(result_df, preserve_index=False), output_file)
+        except (ImportError, TypeError, ValueError):
+            # PyArrow not installed, or a column it cannot convert (e.g. mixed types)
+            result_df.to_csv(output_file, index=False, encoding='utf-8')
+        logger.info(f"{description} saved to '{output_file}'")
+
+        if self.prefer_parquet:
+            # Columnar, dictionary-encoded copy for faster reloading downstream
+            parquet_file = os.path.splitext(output_file)[0] + '.parquet'
+            try:
+                result_df.to_parquet(parquet_file, index=False, compression='zstd')
+                logger.info(f"{description} also saved to '{parquet_file}'")
+            except (ImportError, TypeError, ValueError) as e:
+                logger.warning(f"Could not write Parquet copy ({e})")
+
+        # Try to download file in Google Colab
+        try:
+            from google.colab import files
+            files.download(output_file)
+            logger.info("Download initiated in Colab environment.")
+        except (ImportError, NameError):
+            logger.info("Not running in Colab, skipping download.")
+
     def create_unique_values_dict(self, columns):
         """
         Create a CSV with unique values from specified columns in a single column.
@@ -126,49 +414,275 @@ class CSVDictionaryProcessor:
         logger.info(f"Creating unique values dictionary from columns: {columns}")
 
         try:
-            # Collect all values from all specified columns
-            all_values = []
+            # Collect the distinct values of all specified columns. Deduplicating
+            # only has to hash each column's (cached) distinct values, not every row,
+            # and dict.fromkeys does so in C without building a concatenated array.
+            unique_values = list(dict.fromkeys(chain.from_iterable(
+                self._value_counts(col).index
+                for col in tqdm(columns, desc="Processing columns")
+            )))
+
+            # Create DataFrame with a single column of alphabetically sorted values
+            result_df = pd.DataFrame({
+                'unique_names': np.sort(np.array(unique_values, dtype=object))
+            })
 
-            for col in tqdm(columns, desc="Processing columns"):
-                unique_vals = self.data[col].dropna().unique()
-                all_values.extend(unique_vals)
+            self._save_dict(result_df, output_file, "Unique values dictionary")
+            return output_file
 
-            # Remove duplicates
-            unique_values = list(set(all_values))
+        except Exception as e:
+            logger.error(f"Error creating unique values dictionary: {str(e)}")
+            return None
 
-            # Create DataFrame with a single column for unique values
-            result_df = pd.DataFrame({
-                'unique_names': unique_values
-            })
 
-            # Sort values alphabetically
-            result_df = result_df.sort_values('unique_names').reset_index(drop=True)
+    def _get_clean(self, column):
+        """
+        Get the non-null values of a column as strings.
 
-            # Save to CSV
-            result_df.to_csv(output_file, index=False, encoding='utf-8')
-            logger.info(f"Unique values dictionary saved to '{output_file}'")
+        The result is cached, so the column is only cleaned once for both dictionaries.
+
+        Args:
+            column (str): Column name
+
+        Returns:
+            Series: Non-null values with string dtype (Arrow-backed string columns
+                keep their dtype)
+        """
+        cleaned = self._cleaned.get(column)
+        if cleaned is None:
+            cleaned = self.data[column].dropna()
+            if not _is_arrow_string(cleaned.dtype):
+                cleaned = cleaned.astype('string')
+            self._cleaned[column] = cleaned
+        return cleaned
+
+    def _arrow_strings(self, column):
+        """
+        Get the non-null values of a column as Arrow string arrays.
+
+        Arrow-backed string columns hand over their existing buffers; other
+        columns are converted from their cleaned string values.
+
+        Args:
+            column (str): Column name
+
+        Returns:
+            list: pyarrow arrays of type large_string
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if _is_arrow_string(self.data[column].dtype):
+            values = pc.drop_null(pa.array(self.data[column].array))
+        else:
+            values = pa.array(self._get_clean(column), type=pa.large_string(), from_pandas=True)
+        chunks = values.chunks if isinstance(values, pa.ChunkedArray) else [values]
+        return [chunk.cast(pa.large_string()) for chunk in chunks]
+
+    def _value_counts(self, column):
+        """
+        Get the distinct non-null values of a column with their number of occurrences.
+
+        The result is cached, so building both dictionaries from the same columns
+        hashes every column only once.
+
+        Args:
+            column (str): Column name
+
+        Returns:
+            Series: Occurrence counts indexed by distinct value
+        """
+        counts = self._unique_cache.get(column)
+        if counts is None:
+            counts = self._get_clean(column).value_counts(sort=False)
+            self._unique_cache[column] = counts
+        return counts
+
+    def _count_column_words(self, columns, n_jobs):
+        """
+        Count the words in each column, in parallel when the data is large enough.
+
+        Only the distinct values of a column are split, with every word weighted
+        by how many cells hold the value, so repeated names are tokenized once.
+        Columns are counted independently, so each one can go to its own worker
+        process and the per-column counts are merged afterwards.
+
+        Args:
+            columns (list): List of column names to extract strings from
+            n_jobs (int): Maximum number of worker processes
+
+        Returns:
+            Series: Occurrences of each word across all columns, indexed by word
+        """
+        column_values = []
+        for column in columns:
+            value_counts = self._value_counts(column)
+            column_values.append((value_counts.index.astype(str).tolist(), value_counts.tolist()))
+        n_values = sum(len(texts) for texts, _ in column_values)
+
+        if n_jobs > 1 and len(columns) > 1 and n_values >= PARALLEL_MIN_CELLS:
+            logger.info(f"Counting words in {len(columns)} columns with up to {n_jobs} processes")
+            try:
+                with ProcessPoolExecutor(max_workers=min(n_jobs, len(columns))) as executor:
+                    column_counts = list(executor.map(_count_words, *zip(*column_values)))
+                return self._merge_counts(column_counts)
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"Parallel word counting failed ({e}), counting sequentially")
+
+        column_counts = []
+
+        log_columns = logger.isEnabledFor(logging.INFO)
+
+        for column, (texts, weights) in zip(columns, column_values):
+            if log_columns:
+                logger.info(f"Processing column: {column}")
+            column_counts.append(_count_words(texts, weights))
+
+        return self._merge_counts(column_counts)
+
+    @staticmethod
+    def _merge_counts(column_counts):
+        """
+        Add up per-column word counts.
+
+        Args:
+            column_counts (list): Series of word counts, one per column
+
+        Returns:
+            Series: Occurrences of each word across all columns, indexed by word
+        """
+        if not column_counts:
+            return pd.Series(dtype=np.int64)
+        word_counts = pd.concat(column_counts)
+        return _sum_by_word(word_counts.index.to_numpy(dtype=object), word_counts.to_numpy())
+
+    def _count_column_words_arrow(self, columns):
+        """
+        Count the words in each column with PyArrow compute kernels.
+
+        The cells are split and counted on Arrow's UTF-8 buffers, without creating
+        a Python string per word.
+
+        Args:
+            columns (list): List of column names to extract strings from
 
-            # Try to download file in Google Colab
+        Returns:
+            Series: Occurrences of each word across all columns, indexed by word
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        texts = pa.chunked_array(
+            list(chain.from_iterable(self._arrow_strings(col) for col in columns)),
+            type=pa.large_string()
+        )
+        words = pc.list_flatten(pc.utf8_split_whitespace(texts))
+        # Leading and trailing whitespace leaves empty strings at the ends of a split
+        words = words.filter(pc.not_equal(words, ''))
+        value_counts = pc.value_counts(words)
+
+        word_counts = pd.Series(
+            value_counts.field('counts').to_numpy(zero_copy_only=False).astype(np.int64),
+            index=value_counts.field('values').to_numpy(zero_copy_only=False)
+        )
+        return word_counts.sort_index()
+
+    def _is_arrow_backed(self, columns):
+        """
+        Check whether all the given columns hold Arrow-backed strings.
+
+        Args:
+            columns (list): Column names
+
+        Returns:
+            bool: True if every column has a PyArrow string dtype
+        """
+        # pd.ArrowDtype only exists in pandas 1.5 and later
+        arrow_dtype = getattr(pd, 'ArrowDtype', ())
+        return all(
+            getattr(self.data[col].dtype, 'storage', None) == 'pyarrow'
+            or isinstance(self.data[col].dtype, arrow_dtype)
+            for col in columns
+        )
+
+    def to_arrow_strings(self, columns):
+        """
+        Convert the given columns to Arrow-backed strings, if they are not already.
+
+        Missing values become pd.NA and other values their string representation,
+        as the dictionaries treat them anyway. Afterwards the dictionaries are
+        built with PyArrow compute kernels instead of per-object Python calls.
+        Columns are left as they are if PyArrow is not installed.
+
+        Args:
+            columns (list): Column names
+        """
+        for col in columns:
+            if self._is_arrow_backed([col]):
+                continue
             try:
-                from google.colab import files
-                files.download(output_file)
-                logger.info("Download initiated in Colab environment.")
-            except (ImportError, NameError):
-                logger.info("Not running in Colab, skipping download.")
+                self.data[col] = self.data[col].astype('string[pyarrow]')
+            except (ImportError, TypeError) as e:
+                logger.warning(f"Could not convert column '{col}' to Arrow strings ({e})")
+                return
+            self._cleaned.pop(col, None)
+            self._unique_cache.pop(col, None)
+
+    def create_annotation_dict_arrow(self, columns):
+        """
+        Create the annotation dictionary using PyArrow compute for tokenization.
+
+        Produces the same output as create_annotation_dict. Columns that were not
+        loaded with the PyArrow backend are converted first. If PyArrow is not
+        installed, this falls back to create_annotation_dict.
+
+        Args:
+            columns (list): List of column names to extract strings from
+
+        Returns:
+            str: Path to the created file
+        """
+        if self.data is None:
+            logger.error("No data loaded. Please load a CSV file first.")
+            return None
+
+        # Validate columns
+        invalid_cols = [col for col in columns if col not in self.data.columns]
+        if invalid_cols:
+            logger.error(f"Invalid column(s): {', '.join(invalid_cols)}")
+            return None
 
+        try:
+            import pyarrow.compute
+        except ImportError:
+            logger.warning("PyArrow is not installed, counting words without it")
+            return self.create_annotation_dict(columns)
+
+        output_file = f"{self.filename_base}_dict_annotate.csv"
+        logger.info(f"Creating annotation dictionary from columns: {columns}")
+
+        try:
+            word_counts = self._count_column_words_arrow(columns)
+            result_df = self._annotation_frame(word_counts)
+
+            self._save_dict(result_df, output_file, "Annotation dictionary")
             return output_file
 
         except Exception as e:
-            logger.error(f"Error creating unique values dictionary: {str(e)}")
+            logger.error(f"Error creating annotation dictionary: {str(e)}")
             return None
 
-
-    def create_annotation_dict(self, columns):
+    def create_annotation_dict(self, columns, n_jobs=None):
         """
         Create a CSV with unique strings (split by whitespace), their counts, and annotation columns.
 
+        Arrow-backed columns (loaded with fast_io) are counted with PyArrow compute
+        kernels, other columns in worker processes.
+
         Args:
             columns (list): List of column names to extract strings from
+            n_jobs (int): Maximum number of processes used to count words in
+                columns that are not Arrow-backed (default: half the available CPUs)
 
         Returns:
             str: Path to the created file
@@ -186,51 +700,98 @@ class CSVDictionaryProcessor:
         output_file = f"{self.filename_base}_dict_annotate.csv"
         logger.info(f"Creating annotation dictionary from columns: {columns}")
 
+        if n_jobs is None:
+            n_jobs = max(1, (os.cpu_count() or 1) // 2)
+
         try:
-            # Extract all words from all specified columns
-            all_words = []
+            if self._is_arrow_backed(columns):
+                # Data loaded with fast_io: tokenize in Arrow instead of Python
+                word_counts = self._count_column_words_arrow(columns)
+            else:
+                word_counts = self._count_column_words(columns, n_jobs)
+            result_df = self._annotation_frame(word_counts)
 
-            for column in columns:
-                logger.info(f"Processing column: {column}")
-                # Extract the column data
-                column_data = self.data[column].dropna().astype(str)
+            self._save_dict(result_df, output_file, "Annotation dictionary")
+            return output_file
+
+        except Exception as e:
+            logger.error(f"Error creating annotation dictionary: {str(e)}")
+            return None
+
+    def stream_unique_values_dict(self, columns, chunksize=200_000, encoding='utf-8', sep=','):
+        """
+        Create the unique values dictionary by reading the input file in chunks.
+
+        Produces the same output as create_unique_values_dict, but never holds more
+        than one chunk of the input in memory, so it works on files larger than RAM.
+
+        Args:
+            columns (list): List of column names to extract unique values from
+            chunksize (int): Number of rows to read per chunk
+            encoding (str): Character encoding of the file
+            sep (str): Delimiter in the CSV file
+
+        Returns:
+            str: Path to the created file
+        """
+        chunks = self._read_chunks(columns, chunksize, encoding, sep)
+        if chunks is None:
+            return None
+
+        output_file = f"{self.filename_base}_dict_unique.csv"
+        logger.info(f"Streaming unique values dictionary from columns: {columns}")
 
-                # Split by whitespace and create a flat list of all words
-                for text in tqdm(column_data, desc=f"Extracting words from {column}"):
-                    # Split by whitespace
-                    words = re.findall(r'\S+', text)
-                    all_words.extend(words)
+        try:
+            unique_values = set()
 
-            # Count occurrences of each word
-            word_counts = {}
-            for word in tqdm(all_words, desc="Counting words"):
-                word_counts[word] = word_counts.get(word, 0) + 1
+            for chunk in tqdm(chunks, desc="Processing chunks"):
+                for col in columns:
+                    unique_values.update(chunk[col].dropna().unique())
 
-            # Create DataFrame with words, counts, and empty annotation columns
             result_df = pd.DataFrame({
-                'unique_strings': list(word_counts.keys()),
-                'count': list(word_counts.values()),
-                'annotate_ar': '',
-                'annotate_kunyah': '',
-                'annotate_nasab': '',
-                'annotate_nisbah': ''
+                'unique_names': sorted(unique_values)
             })
 
-            # Sort by count (descending)
-            result_df = result_df.sort_values('count', ascending=False).reset_index(drop=True)
+            self._save_dict(result_df, output_file, "Unique values dictionary")
+            return output_file
 
-            # Save to CSV
-            result_df.to_csv(output_file, index=False, encoding='utf-8')
-            logger.info(f"Annotation dictionary saved to '{output_file}'")
+        except Exception as e:
+            logger.error(f"Error creating unique values dictionary: {str(e)}")
+            return None
 
-            # Try to download file in Google Colab
-            try:
-                from google.colab import files
-                files.download(output_file)
-                logger.info("Download initiated in Colab environment.")
-            except (ImportError, NameError):
-                logger.info("Not running in Colab, skipping download.")
+    def stream_annotation_dict(self, columns, chunksize=200_000, encoding='utf-8', sep=','):
+        """
+        Create the annotation dictionary by reading the input file in chunks.
 
+        Produces the same output as create_annotation_dict, but never holds more
+        than one chunk of the input in memory, so it works on files larger than RAM.
+
+        Args:
+            columns (list): List of column names to extract strings from
+            chunksize (int): Number of rows to read per chunk
+            encoding (str): Character encoding of the file
+            sep (str): Delimiter in the CSV file
+
+        Returns:
+            str: Path to the created file
+        """
+        chunks = self._read_chunks(columns, chunksize, encoding, sep)
+        if chunks is None:
+            return None
+
+        output_file = f"{self.filename_base}_dict_annotate.csv"
+        logger.info(f"Streaming annotation dictionary from columns: {columns}")
+
+        try:
+            word_counts = Counter()
+
+            for chunk in tqdm(chunks, desc="Processing chunks"):
+                for column in columns:
+                    word_counts.update(chain.from_iterable(text.split() for text in chunk[column].dropna().values))
+
+            result_df = self._annotation_frame(pd.Series(word_counts, dtype=np.int64))
+
+            self._save_dict(result_df, output_file, "Annotation dictionary")
             return output_file
 
         except Exception as e:
@@ -240,6 +801,8 @@ class CSVDictionaryProcessor:
 
 def main():
     """Main function to run the CSV processor from the command line."""
+    configure_logging()
+
     print("=" * 50)
     print("CSV Dictionary Processor")
     print("=" * 50)
@@ -268,8 +831,17 @@ def main():
         processor.input_file = args.input_file
         processor.filename_base = os.path.join(args.output_dir, os.path.splitext(os.path.basename(args.input_file))[0])
 
-    if not processor.load_csv():
-        return
+    # Large files are processed in chunks, so only their header is read here
+    stream = processor.is_large_file()
+    if stream:
+        available_columns = processor.read_columns()
+        if available_columns is None:
+            return
+        print(f"\nInput file is larger than {STREAMING_THRESHOLD // (1024 * 1024)} MB, processing it in chunks")
+    else:
+        if not processor.load_csv():
+            return
+        available_columns = list(processor.data.columns)
 
     # Step 2: Get column selection (used for both outputs)
     print("\n" + "=" * 50)
@@ -277,7 +849,8 @@ def main():
     print("=" * 50)
 
     # Get t-prefixed columns as default option
-    t_columns = [col for col in processor.data.columns if col.startswith('t')]
+    column_index = pd.Index(available_columns)
+    t_columns = column_index[column_index.astype(str).str.startswith('t')].tolist()
 
     if t_columns:
         t_columns_str = ', '.join(t_columns)
@@ -293,11 +866,11 @@ def main():
                 columns = [col.strip() for col in column_input.split(',')]
 
                 # Validate columns
-                invalid_cols = [col for col in columns if col not in processor.data.columns]
+                invalid_cols = [col for col in columns if col not in available_columns]
                 if invalid_cols:
                     print(f"Invalid column(s): {', '.join(invalid_cols)}")
                     print("Available columns:")
-                    for i, col in enumerate(processor.data.columns):
+                    for i, col in enumerate(available_columns):
                         print(f"{i+1}. {col}")
                 else:
                     break
@@ -309,11 +882,11 @@ def main():
             columns = [col.strip() for col in column_input.split(',')]
 
             # Validate columns
-            invalid_cols = [col for col in columns if col not in processor.data.columns]
+            invalid_cols = [col for col in columns if col not in available_columns]
             if invalid_cols:
                 print(f"Invalid column(s): {', '.join(invalid_cols)}")
                 print("Available columns:")
-                for i, col in enumerate(processor.data.columns):
+                for i, col in enumerate(available_columns):
                     print(f"{i+1}. {col}")
             else:
                 break
@@ -324,7 +897,10 @@ def main():
     print("=" * 50)
 
     # Create unique values dictionary from all selected columns
-    unique_file = processor.create_unique_values_dict(columns)
+    if stream:
+        unique_file = processor.stream_unique_values_dict(columns)
+    else:
+        unique_file = processor.create_unique_values_dict(columns)
 
     # Step 4: Process for annotation dictionary
     print("\n" + "=" * 50)
@@ -334,7 +910,10 @@ def main():
     print(f"Using the same columns selected earlier: {', '.join(columns)}")
 
     # Create annotation dictionary for all selected columns
-    annotate_file = processor.create_annotation_dict(columns)
+    if stream:
+        annotate_file = processor.stream_annotation_dict(columns)
+    else:
+        annotate_file = processor.create_annotation_dict(columns)
 
     # Summary
     if unique_file and annotate_file:
@@ -343,7 +922,7 @@ def main():
         print("=" * 50)
         print(f"1. Unique values dictionary: {unique_file}")
         print(f"2. Annotation dictionary: {annotate_file}")
-        
+
         if in_colab:
             print("\nFiles have been downloaded. Check your downloads folder.")
         else:
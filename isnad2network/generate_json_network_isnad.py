@@ -20,19 +20,252 @@ Key enhancements:
 import pandas as pd
 import numpy as np
 import os
+import re
+import sys
 import json
-import warnings
 import gc
+import threading
 import traceback
-from datetime import datetime
-from collections import defaultdict
+import zipfile
+from datetime import date, datetime, time
+
+# Shared CSV helpers (relative import when used as part of the package)
+try:
+    from .csv_io import find_t_columns, read_csv
+except ImportError:
+    from csv_io import find_t_columns, read_csv
+
+# orjson serializes considerably faster than the standard library, if installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Indicators of each transmission mode, matched anywhere in a cell's text
+RIWAYAH_INDICATORS = ['حدثنا', 'أخبرنا', 'سمعت', 'عن', 'روى']
+TILAWAH_INDICATORS = ['قرأت', 'قرأ', 'تلا']
+
+_RIWAYAH_RE = re.compile('|'.join(map(re.escape, RIWAYAH_INDICATORS)))
+_TILAWAH_RE = re.compile('|'.join(map(re.escape, TILAWAH_INDICATORS)))
+
+# Primary classification by (has riwayah indicator, has tilawah indicator)
+_CLS = {
+    (True, True): sys.intern("mixed"),
+    (True, False): sys.intern("riwayah"),
+    (False, True): sys.intern("tilawah"),
+    (False, False): sys.intern("other"),
+}
+
+# Result of compare_chain_lengths when every chain length matches
+_EMPTY_MISMATCH = pd.DataFrame({
+    'path_id': pd.Series(dtype=object),
+    'names_length': pd.Series(dtype=np.int32),
+    'trans_length': pd.Series(dtype=np.int32),
+    'difference': pd.Series(dtype=np.int32)
+})
+
+
+class _TBlock:
+    """
+    The t-columns of a dataframe, materialized once as a column-major object array.
+    
+    Attributes:
+        cols: Tuple of column names
+        data: Object array of the cells, one column per name in cols
+        present: Boolean array marking the non-empty (not missing, not "") cells
+    """
+    __slots__ = ("cols", "data", "present")
+    
+    def __init__(self, cols, data, present):
+        self.cols = tuple(cols)
+        self.data = data
+        self.present = present
+    
+    @classmethod
+    def from_frame(cls, df, cols):
+        """
+        Materialize the given columns of a dataframe.
+        
+        Args:
+            df: Names or transmission terms dataframe
+            cols: Columns to materialize
+            
+        Returns:
+            _TBlock of the columns
+        """
+        frame = df[list(cols)]
+        data = np.asfortranarray(frame.to_numpy(dtype=object))
+        present = np.asfortranarray(frame.notna().to_numpy() & frame.ne("").fillna(False).to_numpy(dtype=bool))
+        return cls(cols, data, present)
+    
+    def take(self, cols):
+        """
+        Select and reorder columns without going back to the dataframe.
+        
+        Args:
+            cols: Columns to keep, in the new order
+            
+        Returns:
+            _TBlock of the columns
+        """
+        positions = [self.cols.index(col) for col in cols]
+        return _TBlock(cols, self.data[:, positions], self.present[:, positions])
+
+
+def _read_input_csv(path):
+    """
+    Read an input CSV file into Arrow-backed columns.
+    
+    Uses the multi-threaded PyArrow reader, with empty cells read as missing
+    values; falls back to the pandas reader if PyArrow is not installed, pandas
+    is too old for Arrow-backed columns (before 1.5) or PyArrow cannot parse the
+    file. Parquet files (.parquet) are read directly.
+    
+    Args:
+        path: Path to the CSV or Parquet file
+        
+    Returns:
+        DataFrame with the file's contents
+    """
+    arrow_dtype = getattr(pd, 'ArrowDtype', None)
+    if str(path).endswith('.parquet'):
+        import pyarrow.parquet as pq
+        return pq.read_table(path).to_pandas(types_mapper=arrow_dtype)
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return read_csv(path)
+    if arrow_dtype is None:
+        return read_csv(path)
+    
+    try:
+        table = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(strings_can_be_null=True))
+        # pandas keeps dates and times as written, so read such columns as strings
+        temporal = {field.name: pa.string() for field in table.schema if pa.types.is_temporal(field.type)}
+        if temporal:
+            table = pacsv.read_csv(path, convert_options=pacsv.ConvertOptions(strings_can_be_null=True,
+                                                                               column_types=temporal))
+    except ValueError as e:
+        # pyarrow.ArrowInvalid, e.g. rows with a varying number of fields
+        print(f"  PyArrow could not parse {path} ({e}), using pandas")
+        return read_csv(path)
+    return table.to_pandas(types_mapper=arrow_dtype)
+
+
+def _isin(series, values):
+    """
+    Series.isin that also works for Arrow-backed columns of another type than values.
+    
+    PyArrow cannot match e.g. an all-empty (null-typed) path_id column against
+    strings; such columns are compared as Python objects instead.
+    
+    Args:
+        series: Series to test
+        values: Values to look for
+        
+    Returns:
+        Boolean Series
+    """
+    try:
+        return series.isin(values)
+    except (TypeError, ValueError, NotImplementedError):
+        return series.astype(object).isin(values)
+
+
+def _json_default(value):
+    """Convert values the JSON encoders do not handle natively (missing values, NumPy scalars, dates)."""
+    if value is pd.NA or value is pd.NaT:
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _write_json(data, output_file):
+    """
+    Write data to a UTF-8 JSON file with an indent of two spaces.
+    
+    Uses orjson when it is installed and can serialize the data, the standard
+    json module otherwise.
+    
+    Args:
+        data: JSON-serializable object
+        output_file: Path of the file to write
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(data, default=_json_default,
+                                   option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                                   | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            # e.g. a value type orjson does not support
+            encoded = None
+        if encoded is not None:
+            with open(output_file, 'wb') as f:
+                f.write(encoded)
+            return
+    
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2, default=_json_default)
+
+
+def _write_network_stream(metadata, nodes, edges, paths, output_file):
+    """
+    Write network graph data to a JSON file one record at a time.
+    
+    The records are written to a temporary file next to output_file, which
+    replaces output_file once it is complete, so a failed write never leaves a
+    truncated network file behind.
+    
+    Args:
+        metadata: Network metadata dictionary
+        nodes: List of node dictionaries
+        edges: Iterable of edge dictionaries
+        paths: Iterable of path dictionaries
+        output_file: Path of the file to write
+    """
+    if orjson is not None:
+        def encode(record):
+            return orjson.dumps(record, default=_json_default,
+                                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    else:
+        def encode(record):
+            return json.dumps(record, ensure_ascii=False, default=_json_default)
+    
+    tmp_file = f"{output_file}.tmp"
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write('{\n')
+            f.write(f'  "metadata": {encode(metadata)},\n')
+            
+            for key, records, last in (("nodes", nodes, False), ("edges", edges, False), ("paths", paths, True)):
+                f.write(f'  "{key}": [')
+                separator = '\n'
+                for record in records:
+                    f.write(separator)
+                    f.write('    ')
+                    f.write(encode(record))
+                    separator = ',\n'
+                f.write('\n  ]\n' if last else '\n  ],\n')
+            
+            f.write('}')
+        os.replace(tmp_file, output_file)
+    except Exception:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
 
-# Silence warnings
-warnings.filterwarnings('ignore', category=UserWarning)
 
 class TransmissionTerm:
     """Class to analyze and classify transmission terms"""
     
+    # One instance is kept per distinct cell value, so avoid a __dict__ per object
+    __slots__ = ("original_text", "terms", "primary_classification")
+    
     def __init__(self, term_text):
         """Initialize with term text"""
         self.original_text = str(term_text).strip() if pd.notna(term_text) else ""
@@ -58,23 +291,12 @@ class TransmissionTerm:
         if not self.terms:
             return
             
-        # Basic classification logic
-        riwayah_indicators = ['حدثنا', 'أخبرنا', 'سمعت', 'عن', 'روى']
-        tilawah_indicators = ['قرأت', 'قرأ', 'تلا']
-        
         # Check for mixed mode
-        has_riwayah = any(ri in self.original_text for ri in riwayah_indicators)
-        has_tilawah = any(ti in self.original_text for ti in tilawah_indicators)
+        has_riwayah = _RIWAYAH_RE.search(self.original_text) is not None
+        has_tilawah = _TILAWAH_RE.search(self.original_text) is not None
         
         # Set primary classification
-        if has_riwayah and has_tilawah:
-            self.primary_classification = "mixed"
-        elif has_riwayah:
-            self.primary_classification = "riwayah"
-        elif has_tilawah:
-            self.primary_classification = "tilawah"
-        else:
-            self.primary_classification = "other"
+        self.primary_classification = _CLS[(has_riwayah, has_tilawah)]
     
     def to_dict(self):
         """Convert to dictionary representation"""
@@ -85,39 +307,6 @@ class TransmissionTerm:
         }
 
 
-class CellAnalyzer:
-    """Class to analyze a single cell in the transmission data"""
-    
-    def __init__(self, cell_value, cell_id):
-        """Initialize with cell value and ID"""
-        self.cell_value = cell_value
-        self.cell_id = cell_id
-        self.is_empty = pd.isna(cell_value) or cell_value == ""
-        self.terms = []
-        self.analysis = None
-        
-        # Analyze if not empty
-        if not self.is_empty:
-            self._analyze()
-    
-    def _analyze(self):
-        """Analyze the cell content"""
-        # Create a transmission term object
-        self.analysis = TransmissionTerm(self.cell_value)
-        
-    def is_mixed_mode(self):
-        """Check if the cell contains mixed mode terms"""
-        if self.is_empty or not self.analysis:
-            return False
-        return self.analysis.primary_classification == "mixed"
-    
-    def to_dict(self):
-        """Convert to dictionary representation"""
-        if self.is_empty:
-            return None
-        return self.analysis.to_dict()
-
-
 class IsnadAnalyzer:
     """Class to analyze isnad data across multiple records"""
     
@@ -131,78 +320,126 @@ class IsnadAnalyzer:
         self.mixed_mode_cells = []
         self.cells_with_value_count = 0
         self.cell_analyses = {}
+        self.classification_matrix = None
         
         # Get transmission columns - handle empty dataframes
         self.trans_columns = []
         if not self.trans_df.empty:
-            self.trans_columns = [col for col in self.trans_df.columns 
-                                if col.startswith('t') and col != 'path_id' and col != 'isnad_id']
+            self.trans_columns = list(find_t_columns(self.trans_df))
         
         # Track unique terms
         self.unique_terms = set()
+        
+        # t-columns materialized on first use, shared by the analysis steps
+        self._trans_block = None
+        self._names_block = None
+    
+    @property
+    def trans_block(self):
+        """_TBlock of the transmission columns of trans_df"""
+        if self._trans_block is None:
+            self._trans_block = _TBlock.from_frame(self.trans_df, self.trans_columns)
+        return self._trans_block
+    
+    @property
+    def names_block(self):
+        """_TBlock of the name columns of names_df, in column order"""
+        if self._names_block is None:
+            self._names_block = _TBlock.from_frame(self.names_df, find_t_columns(self.names_df))
+        return self._names_block
     
     def analyze_all_cells(self):
-        """Analyze all cells in the transmission dataframe"""
+        """
+        Analyze all cells in the transmission dataframe.
+        
+        Each distinct cell value is classified once and its TransmissionTerm is
+        shared by every cell holding that value; the per-cell classifications are
+        then filled in with array indexing and kept in classification_matrix.
+        """
         if self.trans_df.empty:
             print("No transmission data to analyze")
             return
             
         print(f"Analyzing {len(self.trans_df)} records with {len(self.trans_columns)} transmission columns...")
         
-        # Process in chunks for memory efficiency
-        chunk_size = 100
-        for start_idx in range(0, len(self.trans_df), chunk_size):
-            end_idx = min(start_idx + chunk_size, len(self.trans_df))
-            chunk = self.trans_df.iloc[start_idx:end_idx]
-            
-            # Process each row in the chunk
-            for idx, row in chunk.iterrows():
-                path_id = row.get('path_id', idx)
-                
-                # Process each transmission column
-                for col in self.trans_columns:
-                    if col in row:
-                        cell_value = row[col]
-                        if pd.notna(cell_value) and cell_value != "":
-                            self.cells_with_value_count += 1
-                            
-                            # Create unique cell ID
-                            cell_id = f"{path_id}_{col}"
-                            
-                            # Analyze cell
-                            analyzer = CellAnalyzer(cell_value, cell_id)
-                            
-                            # Store analysis
-                            if not analyzer.is_empty:
-                                self.cell_analyses[cell_id] = analyzer
-                                
-                                # Track if mixed mode
-                                if analyzer.is_mixed_mode():
-                                    self.mixed_mode_cells.append({
-                                        "path_id": path_id,
-                                        "column": col,
-                                        "value": cell_value
-                                    })
-                                
-                                # Track unique terms
-                                if analyzer.analysis and analyzer.analysis.original_text:
-                                    self.unique_terms.add(analyzer.analysis.original_text)
-            
-            # Force garbage collection to manage memory
-            gc.collect()
+        # Find the non-empty cells, in row-major order
+        block = self.trans_block
+        values = block.data
+        rows, cols = np.nonzero(block.present)
+        cell_values = values[rows, cols]
+        self.cells_with_value_count += len(cell_values)
+        
+        # Collection passes triggered by the burst of small allocations below
+        # cannot free anything, so pause the collector until the analysis is done
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            self._store_analyses(values.shape, rows, cols, cell_values)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
         
         print(f"Found {len(self.mixed_mode_cells)} mixed-mode cells")
         print(f"Found {self.cells_with_value_count} cells with values")
         print(f"Found {len(self.unique_terms)} unique transmission terms")
+    
+    def _store_analyses(self, shape, rows, cols, cell_values):
+        """
+        Analyze the non-empty cells and record the results on the analyzer.
+        
+        Args:
+            shape: Shape of the transmission columns
+            rows: Row position of each non-empty cell
+            cols: Column position of each non-empty cell
+            cell_values: Value of each non-empty cell
+        """
+        # Analyze each distinct value once
+        codes, distinct_values = pd.factorize(cell_values)
+        distinct_terms = [TransmissionTerm(value) for value in distinct_values]
+        distinct_classes = np.array([term.primary_classification for term in distinct_terms], dtype=object)
+        cell_classes = distinct_classes[codes]
+        
+        # Classification of every cell (missing where the cell is empty)
+        classification_matrix = np.full(shape, None, dtype=object)
+        classification_matrix[rows, cols] = cell_classes
+        self.classification_matrix = pd.DataFrame(classification_matrix, index=self.trans_df.index,
+                                                  columns=self.trans_columns)
+        
+        if 'path_id' in self.trans_df.columns:
+            path_ids = self.trans_df['path_id'].to_numpy(dtype=object)
+        else:
+            path_ids = self.trans_df.index.to_numpy(dtype=object)
+        
+        # Store analysis by unique (path_id, column) cell ID
+        trans_columns = self.trans_columns
+        cell_ids = [(path_ids[row], trans_columns[col]) for row, col in zip(rows.tolist(), cols.tolist())]
+        self.cell_analyses.update(zip(cell_ids, [distinct_terms[code] for code in codes.tolist()]))
+        
+        # Track mixed mode cells
+        for i in np.flatnonzero(cell_classes == "mixed"):
+            self.mixed_mode_cells.append({
+                "path_id": path_ids[rows[i]],
+                "column": self.trans_columns[cols[i]],
+                "value": cell_values[i]
+            })
+        
+        # Track unique terms
+        self.unique_terms.update(term.original_text for term in distinct_terms if term.original_text)
 
 
-def generate_network_data(isnad_data, output_file=None):
+def generate_network_data(isnad_data, output_file=None, t_columns=None, stream=False):
     """
     Generate network graph data from the isnad analysis results.
     
     Args:
         isnad_data: Dictionary containing isnad analysis results
         output_file: Path to save the network data JSON (optional)
+        t_columns: Sorted name columns to walk in each path (optional, default:
+            the sorted t-columns found in the paths' names)
+        stream: If True and output_file is given, write edges and paths to the file
+            as they are generated instead of keeping them in memory; the returned
+            dictionary then has empty "edges" and "paths" lists, and an error
+            writing the file is raised
         
     Returns:
         Dictionary with network graph data
@@ -267,121 +504,215 @@ def generate_network_data(isnad_data, output_file=None):
         
         return network
     
-    # Track unique nodes and edges
-    unique_nodes = set()
-    node_dict = {}  # name -> node_id
-    unique_edges = set()  # (source, target, type) tuples
+    # Sort the name columns once rather than for every path
+    if t_columns is None:
+        t_columns = sorted({col for path in paths for col in path.get('names', {})
+                            if isinstance(col, str) and col.startswith('t')
+                            and col != 'path_id' and col != 'isnad_id'})
+    else:
+        t_columns = list(t_columns)
     
     # Process each path
     print(f"Processing {len(paths)} paths to build network...")
     
-    for path_idx, path in enumerate(paths):
-        # Safely get path_id and isnad_id
-        path_id = path.get('path_id', f"unknown_{path_idx}")
-        isnad_id = path.get('isnad_id', "")
-        
-        # Get names data and transmission terms
+    # Flatten the names of all paths into one sequence, path by path, so that
+    # nodes and edges can be found with array operations
+    flat_names = []
+    flat_columns = []
+    path_lengths = []
+    for path in paths:
         names = path.get('names', {})
-        term_analysis = path.get('term_analysis', {})
-        
-        # Get metadata if available
-        metadata = path.get('metadata', {})
+        path_columns = [col for col in t_columns if col in names]
+        flat_names.extend([names[col] for col in path_columns])
+        flat_columns.extend(path_columns)
+        path_lengths.append(len(path_columns))
+    
+    names_arr = np.empty(len(flat_names), dtype=object)
+    names_arr[:] = flat_names
+    path_of = np.repeat(np.arange(len(paths)), path_lengths)
+    
+    return _build_network(network, paths, names_arr, flat_columns, path_of, output_file, stream)
+
+
+def build_network(isnad_data, names_df, name_columns, output_file=None, stream=False):
+    """
+    Generate network graph data, reading the path names straight from the names dataframe.
+    
+    Produces the same result as generate_network_data, but takes the names of
+    all paths from the dataframe's columns in one vectorized pass instead of
+    walking the paths' names dictionaries.
+    
+    Args:
+        isnad_data: Dictionary containing isnad analysis results, with one path per
+            row of names_df
+        names_df: Names dataframe the paths were built from
+        name_columns: Name columns of names_df
+        output_file: Path to save the network data JSON (optional)
+        stream: If True and output_file is given, write edges and paths to the file
+            as they are generated instead of keeping them in memory
         
-        # Extract specific metadata fields that we'll include on edges
-        reader = metadata.get('Reader', '')
-        transmitter = metadata.get('Transmitter', '')
-        path_info = metadata.get('Path', '')
-        mode = metadata.get('_mode', '')
+    Returns:
+        Dictionary with network graph data
+    """
+    return _network_from_block(isnad_data, _TBlock.from_frame(names_df, sorted(name_columns)), output_file, stream)
+
+
+def _network_from_block(isnad_data, block, output_file, stream):
+    """
+    Generate network graph data from the materialized name columns.
+    
+    Args:
+        isnad_data: Dictionary containing isnad analysis results
+        block: _TBlock of the sorted name columns of the names dataframe
+        output_file: Path to save the network data JSON (optional)
+        stream: Whether to write edges and paths to output_file as they are generated
         
-        # Create a path entry with metadata
-        path_entry = {
-            "path_id": path_id,
-            "isnad_id": isnad_id,
-            "nodes": [],
-            "edges": [],
-            "metadata": metadata
-        }
+    Returns:
+        Dictionary with network graph data
+    """
+    t_columns = list(block.cols)
+    paths = isnad_data.get('paths', []) if isnad_data is not None else []
+    if not paths or len(paths) != len(block.data):
+        return generate_network_data(isnad_data, output_file, t_columns=t_columns, stream=stream)
+    
+    print("\nGenerating network graph data...")
+    network = {
+        "metadata": {
+            "generated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "path_count": len(paths),
+            "source": "Isnad Network Generator"
+        },
+        "nodes": [],
+        "edges": [],
+        "paths": []
+    }
+    print(f"Processing {len(paths)} paths to build network...")
+    
+    # The non-empty names of every path, in row-major order
+    rows, cols = np.nonzero(block.present)
+    flat_columns = [t_columns[col] for col in cols.tolist()]
+    
+    return _build_network(network, paths, block.data[rows, cols], flat_columns, rows, output_file, stream)
+
+
+def _build_network(network, paths, names_arr, flat_columns, path_of, output_file, stream):
+    """
+    Find the nodes and edges of the paths and add them to the network.
+    
+    Args:
+        network: Network dictionary with its initial metadata
+        paths: Path dictionaries from the isnad data
+        names_arr: Names of all paths, path by path, in t-column order
+        flat_columns: Column of each name
+        path_of: Index of the path each name belongs to (non-decreasing)
+        output_file: Path to save the network data JSON (optional)
+        stream: Whether to write edges and paths to output_file as they are generated
         
-        # Process nodes and edges in the path
-        t_columns = sorted([col for col in names.keys() 
-                          if isinstance(col, str) and col.startswith('t') 
-                          and col != 'path_id' and col != 'isnad_id'])
-        
-        for i in range(len(t_columns)):
-            col = t_columns[i]
-            if col in names and names[col]:
-                # Process node
-                name = names[col]
-                if name not in node_dict:
-                    node_id = f"n{len(node_dict) + 1}"
-                    node_dict[name] = node_id
-                    unique_nodes.add(name)
-                    network["nodes"].append({
-                        "id": node_id,
-                        "name": name,
-                        "type": "transmitter"
-                    })
+    Returns:
+        Dictionary with network graph data
+    """
+    path_lengths = np.bincount(path_of, minlength=len(paths))
+    path_offsets = np.concatenate([[0], np.cumsum(path_lengths, dtype=np.int64)])
+    present = np.array([bool(name) for name in names_arr], dtype=bool)
+    present_positions = np.flatnonzero(present)
+    
+    # Node index of every name (-1 where empty), numbered in order of first appearance
+    codes, node_names = pd.factorize(names_arr[present])
+    name_codes = np.full(len(names_arr), -1, dtype=np.int64)
+    name_codes[present_positions] = codes
+    first_seen = np.zeros(len(names_arr), dtype=bool)
+    first_seen[present_positions[np.unique(codes, return_index=True)[1]]] = True
+    
+    node_ids = [f"n{node_idx + 1}" for node_idx in range(len(node_names))]
+    network["nodes"] = [
+        {"id": node_id, "name": name, "type": "transmitter"}
+        for node_id, name in zip(node_ids, node_names.tolist())
+    ]
+    
+    # An edge leads from each name to the next one in its path, provided the
+    # next name has already appeared in the network
+    starts = np.flatnonzero(present[:-1] & present[1:] & ~first_seen[1:]
+                            & (path_of[:-1] == path_of[1:]))
+    edge_paths = path_of[starts]
+    edge_columns = [flat_columns[k] for k in starts.tolist()]
+    edge_terms = [paths[path_idx].get('term_analysis', {}).get(col)
+                  for path_idx, col in zip(edge_paths.tolist(), edge_columns)]
+    edge_types = [(analysis.get('primary_classification') if analysis is not None else None) or "unknown"
+                  for analysis in edge_terms]
+    
+    # Keep the first occurrence of each (source, target, type) edge
+    sources = name_codes[starts]
+    targets = name_codes[starts + 1]
+    type_codes, distinct_types = pd.factorize(pd.Series(edge_types, dtype=object))
+    edge_keys = (sources * len(node_names) + targets) * max(len(distinct_types), 1) + type_codes
+    new_edges = np.sort(np.unique(edge_keys, return_index=True)[1])
+    new_edge_paths = edge_paths[new_edges]
+    
+    def iter_edges():
+        """Yield the edges, each carrying the metadata of the path that created it."""
+        for path_idx, path in enumerate(paths):
+            first, last = np.searchsorted(new_edge_paths, [path_idx, path_idx + 1])
+            if first == last:
+                continue
+            
+            # Metadata fields that we'll include on every edge of the path,
+            # kept flat on the edges for better SQL querying
+            metadata = path.get('metadata', {})
+            base_edge = {
+                "Reader": metadata.get('Reader', ''),
+                "Transmitter": metadata.get('Transmitter', ''),
+                "Path": metadata.get('Path', ''),
+                "mode": metadata.get('_mode', ''),
+                "path_id": path.get('path_id', f"unknown_{path_idx}"),
+                "isnad_id": path.get('isnad_id', "")
+            }
+            
+            for edge_idx in range(first, last):
+                candidate = new_edges[edge_idx]
                 
-                # Add node to path
-                path_entry["nodes"].append(node_dict[name])
+                # Create edge with details and the path's metadata fields
+                edge_data = {
+                    "id": f"e{edge_idx + 1}",
+                    "source": node_ids[sources[candidate]],
+                    "target": node_ids[targets[candidate]],
+                    "type": edge_types[candidate]
+                }
+                edge_data.update(base_edge)
                 
-                # Process edge if not the last node
-                if i < len(t_columns) - 1 and t_columns[i+1] in names and names[t_columns[i+1]]:
-                    next_name = names[t_columns[i+1]]
-                    if next_name in node_dict:
-                        source_id = node_dict[name]
-                        target_id = node_dict[next_name]
-                        
-                        # Get transmission term if available
-                        edge_type = "unknown"
-                        if col in term_analysis and term_analysis[col] is not None:
-                            classification = term_analysis[col].get('primary_classification')
-                            if classification:
-                                edge_type = classification
-                        
-                        edge_key = (source_id, target_id, edge_type)
-                        if edge_key not in unique_edges:
-                            edge_id = f"e{len(unique_edges) + 1}"
-                            unique_edges.add(edge_key)
-                            
-                            # Create edge with details
-                            edge_data = {
-                                "id": edge_id,
-                                "source": source_id,
-                                "target": target_id,
-                                "type": edge_type,
-                                # Add metadata fields to edge for better querying
-                                "Reader": reader,
-                                "Transmitter": transmitter,
-                                "Path": path_info,
-                                "mode": mode,
-                                "path_id": path_id,
-                                "isnad_id": isnad_id
-                            }
-                            
-                            # Add transmission term details if available
-                            if col in term_analysis and term_analysis[col] is not None:
-                                original_text = term_analysis[col].get('original_text', '')
-                                if original_text:
-                                    edge_data["label"] = original_text
-                                
-                                # Add detailed term classifications
-                                terms = term_analysis[col].get('terms', [])
-                                if terms:
-                                    edge_data["terms"] = terms
-                            
-                            network["edges"].append(edge_data)
-                            
-                            # Add edge to path
-                            path_entry["edges"].append(edge_id)
-        
-        # Add path to network if it has nodes
-        if path_entry["nodes"]:
-            network["paths"].append(path_entry)
+                # Add transmission term details if available
+                analysis = edge_terms[candidate]
+                if analysis is not None:
+                    original_text = analysis.get('original_text', '')
+                    if original_text:
+                        edge_data["label"] = original_text
+                    
+                    # Add detailed term classifications
+                    terms = analysis.get('terms', [])
+                    if terms:
+                        edge_data["terms"] = terms
+                
+                yield edge_data
+    
+    def iter_paths():
+        """Yield the paths that have nodes, with the ids of the edges they created."""
+        for path_idx, path in enumerate(paths):
+            path_codes = name_codes[path_offsets[path_idx]:path_offsets[path_idx + 1]]
+            path_nodes = [node_ids[code] for code in path_codes.tolist() if code >= 0]
+            if not path_nodes:
+                continue
+            
+            first, last = np.searchsorted(new_edge_paths, [path_idx, path_idx + 1])
+            yield {
+                "path_id": path.get('path_id', f"unknown_{path_idx}"),
+                "isnad_id": path.get('isnad_id', ""),
+                "nodes": path_nodes,
+                "edges": [f"e{edge_idx + 1}" for edge_idx in range(first, last)],
+                "metadata": path.get('metadata', {})
+            }
     
     # Add summary statistics
     network["metadata"]["node_count"] = len(network["nodes"])
-    network["metadata"]["edge_count"] = len(network["edges"])
+    network["metadata"]["edge_count"] = len(new_edges)
     
     # Add metadata statistics if available
     if any('metadata' in path and path['metadata'] for path in paths):
@@ -389,46 +720,28 @@ def generate_network_data(isnad_data, output_file=None):
         paths_with_metadata = sum(1 for path in paths if 'metadata' in path and path['metadata'])
         network["metadata"]["paths_with_metadata"] = paths_with_metadata
     
+    # Write edges and paths to the file as they are generated
+    if stream and output_file:
+        try:
+            print(f"Writing network data to {output_file}...")
+            _write_network_stream(network["metadata"], network["nodes"], iter_edges(), iter_paths(),
+                                  output_file)
+            print(f"✅ Network graph data saved to {output_file}")
+            print(f"  Contains {len(network['nodes'])} nodes and {len(new_edges)} edges")
+        except Exception as e:
+            # The edges and paths are gone once written, so there is no fallback
+            print(f"Failed to save network data: {e}")
+            raise
+        return network
+    
+    network["edges"] = list(iter_edges())
+    network["paths"] = list(iter_paths())
+    
     # Save to file if specified
     if output_file:
         try:
             print(f"Writing network data to {output_file}...")
-            # Use chunked writing for better memory efficiency with large networks
-            with open(output_file, 'w', encoding='utf-8') as f:
-                # Write opening and metadata
-                f.write('{\n')
-                f.write(f'  "metadata": {json.dumps(network["metadata"], ensure_ascii=False)},\n')
-
-                # Write nodes array
-                f.write('  "nodes": [\n')
-                for i, node in enumerate(network["nodes"]):
-                    if i < len(network["nodes"]) - 1:
-                        f.write(f"    {json.dumps(node, ensure_ascii=False)},\n")
-                    else:
-                        f.write(f"    {json.dumps(node, ensure_ascii=False)}\n")
-                f.write('  ],\n')
-
-                # Write edges array
-                f.write('  "edges": [\n')
-                for i, edge in enumerate(network["edges"]):
-                    if i < len(network["edges"]) - 1:
-                        f.write(f"    {json.dumps(edge, ensure_ascii=False)},\n")
-                    else:
-                        f.write(f"    {json.dumps(edge, ensure_ascii=False)}\n")
-                f.write('  ],\n')
-
-                # Write paths array
-                f.write('  "paths": [\n')
-                for i, path in enumerate(network["paths"]):
-                    if i < len(network["paths"]) - 1:
-                        f.write(f"    {json.dumps(path, ensure_ascii=False)},\n")
-                    else:
-                        f.write(f"    {json.dumps(path, ensure_ascii=False)}\n")
-                f.write('  ]\n')
-
-                # Close JSON
-                f.write('}')
-                
+            _write_json(network, output_file)
             print(f"✅ Network graph data saved to {output_file}")
             print(f"  Contains {len(network['nodes'])} nodes and {len(network['edges'])} edges")
         except Exception as e:
@@ -444,17 +757,24 @@ def generate_network_data(isnad_data, output_file=None):
     return network
 
 
-def process_isnad_network(trans_file, names_file, metadata_file=None, output_dir="output/network", skip_filtering=False):
+def process_isnad_network(trans_file=None, names_file=None, metadata_file=None, output_dir="output/network",
+                          skip_filtering=False, trans_df=None, names_df=None, metadata_df=None):
     """
     Main function to process isnad network data.
     Designed to be compatible with the isnad2network_colab.py pipeline.
     
+    Each input can be given as a file or as an already loaded dataframe, which
+    is then used instead of reading the file.
+    
     Args:
         trans_file: Path to transmission terms CSV file
         names_file: Path to names CSV file (typically names_replaced.csv from the previous step)
         metadata_file: Path to metadata CSV file (optional)
         output_dir: Directory for output files
         skip_filtering: If True, skip filtering out invalid records
+        trans_df: Transmission terms dataframe (optional, instead of trans_file)
+        names_df: Names dataframe (optional, instead of names_file)
+        metadata_df: Metadata dataframe (optional, instead of metadata_file)
         
     Returns:
         Dictionary with processing results, compatible with the pipeline
@@ -465,20 +785,27 @@ def process_isnad_network(trans_file, names_file, metadata_file=None, output_dir
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
     
-    # Read input files
+    if (trans_df is None and not trans_file) or (names_df is None and not names_file):
+        return {
+            "status": "error",
+            "error": "No transmission terms or names given"
+        }
+    
+    # Read input files not passed in as dataframes
     try:
-        print(f"Reading transmission terms from {trans_file}...")
-        trans_df = pd.read_csv(trans_file)
-        print(f"  Found {len(trans_df)} records with {len(trans_df.columns)} columns")
+        if trans_df is None:
+            print(f"Reading transmission terms from {trans_file}...")
+            trans_df = _read_input_csv(trans_file)
+            print(f"  Found {len(trans_df)} records with {len(trans_df.columns)} columns")
         
-        print(f"Reading names from {names_file}...")
-        names_df = pd.read_csv(names_file)
-        print(f"  Found {len(names_df)} records with {len(names_df.columns)} columns")
+        if names_df is None:
+            print(f"Reading names from {names_file}...")
+            names_df = _read_input_csv(names_file)
+            print(f"  Found {len(names_df)} records with {len(names_df.columns)} columns")
         
-        metadata_df = None
-        if metadata_file:
+        if metadata_df is None and metadata_file:
             print(f"Reading metadata from {metadata_file}...")
-            metadata_df = pd.read_csv(metadata_file)
+            metadata_df = _read_input_csv(metadata_file)
             print(f"  Found {len(metadata_df)} records with {len(metadata_df.columns)} columns")
     except Exception as e:
         print(f"Error reading input files: {e}")
@@ -529,19 +856,23 @@ def process_isnad_network(trans_file, names_file, metadata_file=None, output_dir
             return names_df, trans_df, metadata_df, 0
         
         # Find valid path_ids (not NA in either dataframe)
-        valid_name_ids = names_df[pd.notna(names_df['path_id'])]['path_id'].unique()
-        valid_trans_ids = trans_df[pd.notna(trans_df['path_id'])]['path_id'].unique()
+        valid_name_ids = np.asarray(names_df['path_id'].dropna().unique(), dtype=object)
+        valid_trans_ids = np.asarray(trans_df['path_id'].dropna().unique(), dtype=object)
         
         # Find common valid path_ids
-        valid_ids = set(valid_name_ids).intersection(set(valid_trans_ids))
+        try:
+            valid_ids = np.intersect1d(valid_name_ids, valid_trans_ids, assume_unique=True)
+        except TypeError:
+            # path_ids of mixed types cannot be sorted
+            valid_ids = list(set(valid_name_ids).intersection(valid_trans_ids))
         
         # Filter dataframes
-        names_df = names_df[names_df['path_id'].isin(valid_ids)].reset_index(drop=True)
-        trans_df = trans_df[trans_df['path_id'].isin(valid_ids)].reset_index(drop=True)
+        names_df = names_df[_isin(names_df['path_id'], valid_ids)].reset_index(drop=True)
+        trans_df = trans_df[_isin(trans_df['path_id'], valid_ids)].reset_index(drop=True)
         
         # Filter metadata if provided
         if metadata_df is not None and 'path_id' in metadata_df.columns:
-            metadata_df = metadata_df[metadata_df['path_id'].isin(valid_ids)].reset_index(drop=True)
+            metadata_df = metadata_df[_isin(metadata_df['path_id'], valid_ids)].reset_index(drop=True)
         
         # Calculate filtered count
         filtered_count = original_count - len(names_df)
@@ -580,67 +911,84 @@ def process_isnad_network(trans_file, names_file, metadata_file=None, output_dir
         "paths": []
     }
     
-    # Get classification statistics
-    classifications = defaultdict(int)
-    for cell_id, cell_analyzer in analyzer.cell_analyses.items():
-        if cell_analyzer.analysis:
-            classification = cell_analyzer.analysis.primary_classification
-            classifications[classification] += 1
-    
-    isnad_data["term_statistics"]["by_classification"] = dict(classifications)
+    # Get classification statistics, counting each (path_id, column) cell once
+    if analyzer.classification_matrix is not None:
+        if 'path_id' in analyzer.trans_df.columns:
+            path_ids = analyzer.trans_df['path_id']
+        else:
+            path_ids = analyzer.trans_df.index.to_series()
+        if path_ids.duplicated().any():
+            # Repeated path_ids share cells in cell_analyses (the last non-empty
+            # cell wins), so count its terms to key missing path_ids the same way
+            cell_classes = [term.primary_classification for term in analyzer.cell_analyses.values()]
+        else:
+            cell_classes = analyzer.classification_matrix.to_numpy().ravel()
+        classifications = pd.Series(cell_classes, dtype=object).value_counts(dropna=True)
+        isnad_data["term_statistics"]["by_classification"] = {
+            classification: int(count) for classification, count in classifications.items()
+        }
     
     # Process paths
     print("Building path data...")
     
+    # Index metadata rows by path_id (first row wins, as with a filtered lookup)
+    meta_map = {}
+    if metadata_df is not None and not metadata_df.empty and 'path_id' in metadata_df.columns:
+        for meta_record in metadata_df.to_dict('records'):
+            meta_path_id = meta_record['path_id']
+            if pd.notna(meta_path_id) and meta_path_id not in meta_map:
+                meta_map[meta_path_id] = {
+                    col: value for col, value in meta_record.items()
+                    if col != 'path_id' and pd.notna(value)
+                }
+    
+    # path_ids that have a row of transmission terms
+    trans_path_ids = set()
+    if not analyzer.trans_df.empty and 'path_id' in analyzer.trans_df.columns:
+        trans_path_ids = set(analyzer.trans_df['path_id'].dropna())
+    
+    # Name columns, materialized once for the paths and the network
+    names_block = analyzer.names_block
+    name_columns = list(names_block.cols)
+    
+    # Safely get path_id, defaulting to index if not present
+    path_ids = names_df['path_id'].tolist() if 'path_id' in names_df.columns else names_df.index.tolist()
+    isnad_ids = names_df['isnad_id'].tolist() if 'isnad_id' in names_df.columns else [""] * len(names_df)
+    
+    paths = isnad_data["paths"]
+    cell_analyses = analyzer.cell_analyses
+    
     # Process each row in names_df
-    for idx, row in names_df.iterrows():
-        # Safely get path_id, defaulting to index if not present
-        path_id = row.get('path_id', idx) if 'path_id' in row else idx
-        isnad_id = row.get('isnad_id', "") if 'isnad_id' in row else ""
-        
+    for path_id, isnad_id, row, row_present in zip(path_ids, isnad_ids, names_block.data.tolist(),
+                                                   names_block.present.tolist()):
         # Get metadata if available
-        metadata = {}
-        if metadata_df is not None and not metadata_df.empty and 'path_id' in metadata_df.columns:
-            meta_row = metadata_df[metadata_df['path_id'] == path_id]
-            if not meta_row.empty:
-                for col in meta_row.columns:
-                    if col != 'path_id':
-                        value = meta_row.iloc[0][col]
-                        if pd.notna(value):
-                            metadata[col] = value
-        
-        # Create path entry
-        path_entry = {
-            "path_id": path_id,
-            "isnad_id": isnad_id,
-            "names": {},
-            "term_analysis": {},
-            "metadata": metadata
-        }
-        
-        # Add name columns
-        name_columns = [col for col in row.index 
-                       if isinstance(col, str) and col.startswith('t') 
-                       and col != 'path_id' and col != 'isnad_id']
+        metadata = meta_map.get(path_id, {})
         
-        for col in name_columns:
-            name = row[col]
-            if pd.notna(name) and name != "":
-                path_entry["names"][col] = name
+        # Add name columns; names repeat across many paths, so share one string
+        # object per distinct name
+        names = {
+            col: sys.intern(name) if type(name) is str else name
+            for col, name, present in zip(name_columns, row, row_present)
+            if present
+        }
         
         # Add transmission terms analysis
-        if not analyzer.trans_df.empty and 'path_id' in analyzer.trans_df.columns:
-            trans_row = analyzer.trans_df[analyzer.trans_df['path_id'] == path_id]
-            if not trans_row.empty:
-                for col in analyzer.trans_columns:
-                    if col in trans_row.columns:
-                        cell_id = f"{path_id}_{col}"
-                        if cell_id in analyzer.cell_analyses:
-                            cell_analyzer = analyzer.cell_analyses[cell_id]
-                            path_entry["term_analysis"][col] = cell_analyzer.to_dict()
-        
-        # Add to paths
-        isnad_data["paths"].append(path_entry)
+        term_analysis = {}
+        if path_id in trans_path_ids:
+            term_analysis = {
+                col: cell_analyses[(path_id, col)].to_dict()
+                for col in analyzer.trans_columns
+                if (path_id, col) in cell_analyses
+            }
+        
+        # Add path entry
+        paths.append({
+            "path_id": path_id,
+            "isnad_id": isnad_id,
+            "names": names,
+            "term_analysis": term_analysis,
+            "metadata": metadata
+        })
     
     # Define output file paths to match pipeline expectations
     isnad_output_file = os.path.join(output_dir, "isnad_network_data.json")
@@ -649,8 +997,7 @@ def process_isnad_network(trans_file, names_file, metadata_file=None, output_dir
     # Save isnad data
     try:
         print(f"Writing isnad data to {isnad_output_file}...")
-        with open(isnad_output_file, 'w', encoding='utf-8') as f:
-            json.dump(isnad_data, f, ensure_ascii=False, indent=2)
+        _write_json(isnad_data, isnad_output_file)
         print(f"✅ Isnad data saved to {isnad_output_file}")
     except Exception as e:
         print(f"Error writing isnad data: {e}")
@@ -660,7 +1007,14 @@ def process_isnad_network(trans_file, names_file, metadata_file=None, output_dir
         }
     
     # Generate network data
-    network_data = generate_network_data(isnad_data, network_output_file)
+    try:
+        network_data = _network_from_block(isnad_data, names_block.take(sorted(name_columns)),
+                                           network_output_file, stream=True)
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": f"Failed to write network data: {str(e)}"
+        }
     
     # Prepare and return pipeline-compatible result
     result = {
@@ -755,11 +1109,11 @@ def main():
         sample_dir = 'sample_data'
         trans_df, names_df, metadata_df = create_sample_data(sample_dir)
         
-        # Process sample data
+        # Process sample data, without reading back the files just written
         result = process_isnad_network(
-            trans_file=f"{sample_dir}/transmission_terms.csv",
-            names_file=f"{sample_dir}/names.csv",
-            metadata_file=f"{sample_dir}/metadata.csv",
+            trans_df=trans_df,
+            names_df=names_df,
+            metadata_df=metadata_df,
             output_dir=f"{sample_dir}/output/network"
         )
         
@@ -815,17 +1169,40 @@ def main():
                     from google.colab import files
                     download = input("\nDownload output files? (y/n): ").strip().lower() == 'y'
                     if download:
-                        for path in result["output_files"].values():
-                            files.download(path)
-                        print("✅ Files downloaded")
+                        # Zip the outputs so they are fetched in a single download
+                        output_paths = list(result["output_files"].values())
+                        zip_path = os.path.join(os.path.dirname(output_paths[0]), "isnad_outputs.zip")
+                        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
+                            for path in output_paths:
+                                zipf.write(path, os.path.basename(path))
+                        files.download(zip_path)
+                        print(f"✅ Files downloaded as {os.path.basename(zip_path)}")
                 except Exception as e:
                     print(f"⚠️ Error during download: {e}")
         else:
             print(f"\n❌ Error processing data: {result.get('error', 'Unknown error')}")
 
 
+def _chain_lengths(df, t_cols):
+    """
+    Count the non-empty cells in the t-columns of each row.
+    
+    Args:
+        df: Names or transmission terms dataframe
+        t_cols: Columns to count
+        
+    Returns:
+        int32 array with the chain length of each row
+    """
+    # Missing values (None, NaN, pd.NA) are not counted, nor are empty strings
+    frame = df[t_cols]
+    present = frame.notna().to_numpy(dtype=bool)
+    arr = np.where(present, frame.to_numpy(dtype=object), None)
+    return np.count_nonzero(present & (arr != ""), axis=1).astype(np.int32)
+
+
 # Add a compatibility function to match the original script's expected interface
-def compare_chain_lengths(names_df, trans_df, output_dir='.'):
+def compare_chain_lengths(names_df, trans_df, output_dir='.', sync_io=False):
     """
     Compare the chain lengths in the names and transmission dataframes.
     Creates a report of mismatches.
@@ -834,6 +1211,9 @@ def compare_chain_lengths(names_df, trans_df, output_dir='.'):
         names_df: Names dataframe
         trans_df: Transmission terms dataframe
         output_dir: Directory to save the report
+        sync_io: If True, write the report before returning; otherwise it is
+            written on a background thread, which the interpreter waits for
+            before exiting
         
     Returns:
         DataFrame with mismatches
@@ -850,78 +1230,75 @@ def compare_chain_lengths(names_df, trans_df, output_dir='.'):
         print("⚠️ Cannot compare chain lengths: missing path_id column in one or both dataframes")
         return pd.DataFrame()
     
-    # Create empty dataframe for mismatches
-    mismatch_df = pd.DataFrame(columns=[
-        'path_id', 'names_length', 'trans_length', 'difference'
-    ])
-    
     # Get t-columns (safely handle column types)
-    name_t_cols = [col for col in names_df.columns 
-                  if isinstance(col, str) and col.startswith('t') 
-                  and col != 'path_id' and col != 'isnad_id']
-    trans_t_cols = [col for col in trans_df.columns 
-                   if isinstance(col, str) and col.startswith('t') 
-                   and col != 'path_id' and col != 'isnad_id']
-    
     # Sort columns to ensure proper comparison
-    name_t_cols.sort()
-    trans_t_cols.sort()
-    
-    # Process each unique path_id
-    mismatches = []
-    unique_path_ids = names_df['path_id'].unique()
-    
-    for path_id in unique_path_ids:
-        # Get matching rows
-        names_rows = names_df[names_df['path_id'] == path_id]
-        trans_rows = trans_df[trans_df['path_id'] == path_id]
-        
-        if len(names_rows) == 0 or len(trans_rows) == 0:
-            print(f"⚠️ Missing data for path_id {path_id}")
-            continue
-        
-        # Use first row for this path_id
-        names_row = names_rows.iloc[0]
-        trans_row = trans_rows.iloc[0]
-        
-        # Count non-NA values in names
-        names_count = sum(1 for col in name_t_cols 
-                          if col in names_row and pd.notna(names_row[col]) and names_row[col] != "")
-        
-        # Count non-NA values in transmission terms
-        trans_count = sum(1 for col in trans_t_cols 
-                          if col in trans_row and pd.notna(trans_row[col]) and trans_row[col] != "")
-        
-        # Check if counts match
-        if names_count != trans_count:
-            mismatches.append({
-                'path_id': path_id,
-                'names_length': names_count,
-                'trans_length': trans_count,
-                'difference': names_count - trans_count
-            })
+    name_t_cols = sorted(find_t_columns(names_df))
+    trans_t_cols = sorted(find_t_columns(trans_df))
+    
+    # Chain length of the first row of each path_id, copying only the columns needed
+    names_first = names_df.loc[~names_df['path_id'].duplicated(), ['path_id'] + name_t_cols]
+    trans_first = trans_df.loc[~trans_df['path_id'].duplicated(), ['path_id'] + trans_t_cols].set_index('path_id')
+    names_lengths = _chain_lengths(names_first, name_t_cols)
+    trans_lengths = pd.Series(_chain_lengths(trans_first, trans_t_cols), index=trans_first.index)
+    
+    # Look up each path_id's transmission chain (reindex rather than merge, so
+    # path_id columns of different dtypes simply don't match)
+    path_ids = names_first['path_id']
+    matched = trans_lengths.reindex(path_ids.to_numpy()).to_numpy()
+    missing = path_ids.isna().to_numpy() | pd.isna(matched)
+    for path_id in path_ids[missing]:
+        print(f"⚠️ Missing data for path_id {path_id}")
+    
+    found = ~missing
+    names_lengths = names_lengths[found]
+    trans_lengths = matched[found].astype(np.int32)
+    differs = names_lengths != trans_lengths
+    if not differs.any():
+        print("✅ No chain length mismatches found!")
+        return _EMPTY_MISMATCH.copy()
     
     # Create dataframe from mismatches
-    if mismatches:
-        mismatch_df = pd.DataFrame(mismatches)
-        
-        # Save to file
-        report_path = os.path.join(output_dir, "chain_length_mismatches.csv")
-        mismatch_df.to_csv(report_path, index=False)
-        print(f"⚠️ Found {len(mismatch_df)} chains with length mismatches between names and transmission terms")
-        print(f"⚠️ Saved mismatch report to {report_path}")
+    names_lengths = names_lengths[differs]
+    trans_lengths = trans_lengths[differs]
+    mismatch_df = pd.DataFrame({
+        'path_id': path_ids[found][differs].tolist(),
+        'names_length': names_lengths,
+        'trans_length': trans_lengths,
+        'difference': names_lengths - trans_lengths
+    })
+    
+    print(f"⚠️ Found {len(mismatch_df)} chains with length mismatches between names and transmission terms")
+    
+    # Save to file
+    report_path = os.path.join(output_dir, "chain_length_mismatches.csv")
+    if sync_io:
+        _save_mismatch_report(mismatch_df, report_path)
     else:
-        print("✅ No chain length mismatches found!")
+        # Write a copy, so changes the caller makes to the result don't reach the
+        # report; the interpreter waits for the (non-daemon) thread before exiting
+        threading.Thread(target=_save_mismatch_report, args=(mismatch_df.copy(), report_path)).start()
     
     return mismatch_df
 
+
+def _save_mismatch_report(mismatch_df, report_path):
+    """
+    Save the chain length mismatches to CSV.
+    
+    Args:
+        mismatch_df: Mismatches found by compare_chain_lengths
+        report_path: Path of the report
+    """
+    mismatch_df.to_csv(report_path, index=False)
+    print(f"⚠️ Saved mismatch report to {report_path}")
+
 # Provide all the necessary functions to make the script compatible with the pipeline
 __all__ = [
     'TransmissionTerm',
-    'CellAnalyzer', 
     'IsnadAnalyzer',
     'compare_chain_lengths',
     'generate_network_data',
+    'build_network',
     'process_isnad_network'
 ]
 
@@ -17,11 +17,20 @@ import os
 import re
 from collections import defaultdict
 
+# Shared CSV reader (relative import when used as part of the package)
+try:
+    from .csv_io import read_csv
+except ImportError:
+    from csv_io import read_csv
+
 class NetworkNameProcessor:
     """
     Class for processing network names and replacing them based on a mapping.
     """
-    def __init__(self, names_file, nodelist_file, output_file=None):
+    __slots__ = ('names_file', 'nodelist_file', 'output_file', 'prefer_parquet',
+                 'names_df', 'nodelist_df', 'mapping_dict', 'time_columns', 'stats')
+
+    def __init__(self, names_file, nodelist_file, output_file=None, prefer_parquet=False):
         """
         Initialize the processor with file paths.
 
@@ -29,10 +38,13 @@ class NetworkNameProcessor:
             names_file (str): Path to the CSV file with network pathways
             nodelist_file (str): Path to the CSV file with node name mappings
             output_file (str): Path to the output file (default: names_replaced.csv)
+            prefer_parquet (bool): Whether to also save the results as Parquet (same
+                path with a .parquet extension), for faster loading by the later steps
         """
         self.names_file = names_file
         self.nodelist_file = nodelist_file
         self.output_file = output_file or 'names_replaced.csv'
+        self.prefer_parquet = prefer_parquet
 
         # Data storage
         self.names_df = None
@@ -56,10 +68,10 @@ class NetworkNameProcessor:
         """
         try:
             print(f"Loading names file: {self.names_file}")
-            self.names_df = pd.read_csv(self.names_file)
+            self.names_df = read_csv(self.names_file)
 
             print(f"Loading nodelist file: {self.nodelist_file}")
-            self.nodelist_df = pd.read_csv(self.nodelist_file)
+            self.nodelist_df = read_csv(self.nodelist_file)
 
             print(f"Loaded {len(self.names_df)} pathways and {len(self.nodelist_df)} node mappings")
             return True
@@ -245,20 +257,43 @@ class NetworkNameProcessor:
             # Save the replaced names
             names_replaced_df.to_csv(self.output_file, index=False)
             print(f"Saved replaced names to {self.output_file}")
+            if self.prefer_parquet:
+                self.save_parquet(names_replaced_df)
 
-            # Save the unmatched names
-            if self.stats['unmatched_names']:
-                unmatched_file = 'unmatched_names.txt'
-                with open(unmatched_file, 'w') as f:
-                    for name in sorted(self.stats['unmatched_names']):
-                        f.write(f"{name}\n")
-                print(f"Saved {len(self.stats['unmatched_names'])} unmatched names to {unmatched_file}")
-
+            self.save_unmatched_names()
             return True
         except Exception as e:
             print(f"Error saving results: {e}")
             return False
 
+    def save_parquet(self, names_replaced_df):
+        """
+        Save a zstd-compressed Parquet copy of the replaced names next to the output file.
+
+        Args:
+            names_replaced_df (DataFrame): DataFrame with replaced names
+        """
+        parquet_file = os.path.splitext(self.output_file)[0] + '.parquet'
+        try:
+            names_replaced_df.to_parquet(parquet_file, index=False, compression='zstd')
+            print(f"Saved replaced names to {parquet_file}")
+        except (ImportError, TypeError, ValueError) as e:
+            print(f"Could not write Parquet copy ({e})")
+            # Don't leave a partial file that would be read instead of the CSV
+            if os.path.exists(parquet_file):
+                os.remove(parquet_file)
+
+    def save_unmatched_names(self):
+        """
+        Save the names not found in the mapping to unmatched_names.txt.
+        """
+        if self.stats['unmatched_names']:
+            unmatched_file = 'unmatched_names.txt'
+            with open(unmatched_file, 'w') as f:
+                for name in sorted(self.stats['unmatched_names']):
+                    f.write(f"{name}\n")
+            print(f"Saved {len(self.stats['unmatched_names'])} unmatched names to {unmatched_file}")
+
     def analyze_network(self):
         """
         Analyze the network structure and provide insights.
@@ -328,6 +363,65 @@ class NetworkNameProcessor:
         # Save results
         return self.save_results(names_replaced_df)
 
+    def process_chunk(self, chunk):
+        """
+        Replace the names in one chunk of the names file.
+
+        Statistics accumulate over the chunks; the mapping and time columns are
+        set up from the first chunk.
+
+        Args:
+            chunk (DataFrame): Rows of the names file
+
+        Returns:
+            DataFrame: The chunk with replaced and properly capitalized names
+        """
+        self.names_df = chunk.reset_index(drop=True)
+        return self.name_replaces()
+
+    def process_chunked(self, chunksize):
+        """
+        Run the processing pipeline, reading the names file in chunks.
+
+        Each chunk is appended to the output file as soon as it is processed, so
+        the names file is never held in memory at once. The network analysis
+        of process() is skipped, as it needs all pathways. No Parquet copy is
+        written, since the column types of separate chunks need not agree; with
+        prefer_parquet, an earlier copy is removed so the CSV is read instead.
+
+        Args:
+            chunksize (int): Number of rows per chunk
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            print(f"Loading nodelist file: {self.nodelist_file}")
+            self.nodelist_df = read_csv(self.nodelist_file)
+
+            print(f"Processing names file {self.names_file} in chunks of {chunksize} rows")
+            rows = 0
+            for chunk in read_csv(self.names_file, chunksize=chunksize):
+                names_replaced_df = self.process_chunk(chunk)
+                names_replaced_df.to_csv(self.output_file, mode='w' if rows == 0 else 'a',
+                                         header=rows == 0, index=False)
+                rows += len(chunk)
+
+            if rows == 0:
+                read_csv(self.names_file, nrows=0).to_csv(self.output_file, index=False)
+            print(f"Saved {rows} pathways with replaced names to {self.output_file}")
+
+            parquet_file = os.path.splitext(self.output_file)[0] + '.parquet'
+            if self.prefer_parquet and os.path.exists(parquet_file):
+                os.remove(parquet_file)
+                print(f"Removed {parquet_file}, which is not written when processing in chunks")
+
+            self.save_unmatched_names()
+            return True
+        except Exception as e:
+            print(f"Error processing chunks: {e}")
+            return False
+
 
 # This is the function you'll call directly in Colab
 def process_network_names(names_file='names.csv', nodelist_file='nodelist.csv', output_file='names_replaced.csv'):
@@ -30,6 +30,9 @@ setup(
         "numpy>=1.18.0",
         "tqdm>=4.45.0",
     ],
+    extras_require={
+        "fast": ["pyarrow>=7.0.0", "orjson>=3.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "isnad2network=isnad2network.__main__:main",
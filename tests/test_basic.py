@@ -5,40 +5,53 @@
 Basic tests for the isnad2network package.
 """
 
+import importlib
+import importlib.util
 import unittest
-import argparse
-import sys
-import os
+
+# Module of the package and an attribute it must provide
+CASES = [
+    ("isnad2network.match_replace_isnads", "process_network_names"),
+    ("isnad2network.dict_creator", "CSVDictionaryProcessor"),
+    ("isnad2network.generate_json_network_isnad", "process_isnad_network"),
+    ("isnad2network.isnad2network_cli", "main"),
+    ("isnad2network", "NetworkNameProcessor"),
+]
+
 
 class TestBasicImports(unittest.TestCase):
     """Test basic imports of the package."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Import each module once for all tests."""
+        cls.modules = {name: importlib.import_module(name) for name, _ in CASES}
+
     def test_can_import_modules(self):
         """Test that all main modules can be imported."""
-        try:
-            # Import from the package, not directly
-            from isnad2network import NetworkNameProcessor
-            # Check that the imported class has what we expect
-            self.assertTrue(hasattr(NetworkNameProcessor, 'process'))
-        except ImportError:
-            self.fail("Could not import NetworkNameProcessor from isnad2network")
-    
+        for name, attr in CASES:
+            with self.subTest(module=name):
+                self.assertIsNotNone(importlib.util.find_spec(name), f"Could not find {name}")
+                self.assertTrue(hasattr(self.modules[name], attr))
+
+        from isnad2network import NetworkNameProcessor
+        self.assertTrue(hasattr(NetworkNameProcessor, 'process'))
+
     def test_cli_parser(self):
         """Test that the CLI argument parser can be created."""
-        # Skip this test for now - we'll fix it later
-        self.skipTest("Skipping CLI parser test while fixing package structure")
-        
-        # The original test code is commented out
-        """
-        try:
-            # Import the CLI module from the package
-            from isnad2network import isnad2network_cli
-            # Create a parser to test basic functionality
-            parser = isnad2network_cli.argparse.ArgumentParser()
-            self.assertIsInstance(parser, argparse.ArgumentParser)
-        except ImportError:
-            self.fail("Could not import isnad2network_cli from isnad2network")
-        """
+        import argparse
+
+        parser = self.modules["isnad2network.isnad2network_cli"].build_parser()
+        self.assertIsInstance(parser, argparse.ArgumentParser)
+
+        args = parser.parse_args([
+            "--input-names", "names.csv", "--nodelist", "nodelist.csv",
+            "--trans-terms", "trans.csv", "--path-metadata", "metadata.csv", "--steps", "3"
+        ])
+        self.assertEqual(args.input_names_file, "names.csv")
+        self.assertEqual(args.steps, 3)
+        self.assertEqual(args.output_dir, "output")
+        self.assertFalse(args.skip_filtering)
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
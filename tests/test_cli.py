@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the command-line pipeline.
+"""
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from isnad2network import isnad2network_cli
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "data")
+
+
+class TestRunPipeline(unittest.TestCase):
+    """Test the complete pipeline on the sample data."""
+
+    def setUp(self):
+        """Work in a temporary directory and remember the logging handlers."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp_dir)
+        self.handlers = logging.getLogger().handlers[:]
+
+    def tearDown(self):
+        """Remove the pipeline's logging handlers and the temporary directory."""
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            if handler not in self.handlers:
+                root.removeHandler(handler)
+                handler.close()
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmp_dir)
+
+    def _run(self, output_dir, *options):
+        """Run the pipeline and collect its outputs, without generation times."""
+        args = isnad2network_cli.build_parser().parse_args([
+            "--input-names", os.path.join(DATA_DIR, "names.csv"),
+            "--nodelist", os.path.join(DATA_DIR, "nodelist.csv"),
+            "--trans-terms", os.path.join(DATA_DIR, "transmissionterms.csv"),
+            "--path-metadata", os.path.join(DATA_DIR, "pathmetadata.csv"),
+            "--output-dir", output_dir,
+        ] + list(options))
+        self.assertTrue(isnad2network_cli.run_pipeline(args))
+
+        outputs = {}
+        for subdir in ("", "dictionaries", "network"):
+            directory = os.path.join(output_dir, subdir)
+            for name in sorted(os.listdir(directory)):
+                path = os.path.join(directory, name)
+                if name.endswith(".json"):
+                    with open(path, encoding='utf-8') as f:
+                        data = json.load(f)
+                    data["metadata"].pop("generated")
+                    outputs[os.path.join(subdir, name)] = data
+                elif name.endswith(".csv"):
+                    with open(path, encoding='utf-8') as f:
+                        outputs[os.path.join(subdir, name)] = f.read()
+        return outputs
+
+    def test_parallel_matches_sequential(self):
+        """Test that steps 2 and 3 give the same outputs in worker processes and in order."""
+        expected = self._run("sequential", "--sequential")
+        self.assertIn(os.path.join("network", "network_graph_data.json"), expected)
+        self.assertIn(os.path.join("dictionaries", "names_replaced_dict_annotate.csv"), expected)
+
+        self.assertEqual(self._run("parallel"), expected)
+        with mock.patch.object(isnad2network_cli, "ProcessPoolExecutor", side_effect=OSError("no processes")):
+            self.assertEqual(self._run("fallback"), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
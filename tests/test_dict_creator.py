@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the dictionary creation module.
+"""
+
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from isnad2network.dict_creator import CSVDictionaryProcessor
+
+# PyArrow is an optional dependency (the "fast" extra)
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+class TestCSVDictionaryProcessor(unittest.TestCase):
+    """Test the unique values and annotation dictionaries."""
+
+    def setUp(self):
+        """Write a small names CSV to a temporary directory."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.input_file = os.path.join(self.tmp_dir, "names.csv")
+        pd.DataFrame({
+            'path_id': ['isnad_001', 'isnad_002', 'isnad_003'],
+            't0': ['al-Dānī', 'al-Dānī', 'al-Dānī'],
+            't-1': ['ʾAbū Bakr b. Muǧāhid', 'ʾAbū ʿUmar al-Dūrī', None],
+            't-2': ['Nāfiʿ', None, 'ʾAbū  Bakr'],
+        }).to_csv(self.input_file, index=False)
+
+        self.processor = CSVDictionaryProcessor()
+        self.processor.input_file = self.input_file
+        self.processor.filename_base = os.path.join(self.tmp_dir, "names")
+        self.assertTrue(self.processor.load_csv(skip_display=True))
+        self.columns = ['t0', 't-1', 't-2']
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.tmp_dir)
+
+    def test_unique_values_dict(self):
+        """Test that unique values are collected across columns and sorted."""
+        output_file = self.processor.create_unique_values_dict(self.columns)
+        result = pd.read_csv(output_file)
+        self.assertEqual(list(result['unique_names']), sorted([
+            'al-Dānī', 'ʾAbū Bakr b. Muǧāhid', 'ʾAbū ʿUmar al-Dūrī', 'Nāfiʿ', 'ʾAbū  Bakr'
+        ]))
+
+    def test_annotation_dict(self):
+        """Test that whitespace-split strings are counted across columns."""
+        output_file = self.processor.create_annotation_dict(self.columns)
+        result = pd.read_csv(output_file, keep_default_na=False)
+        self.assertEqual(list(result.columns), [
+            'unique_strings', 'count', 'annotate_ar', 'annotate_kunyah', 'annotate_nasab', 'annotate_nisbah'
+        ])
+        counts = dict(zip(result['unique_strings'], result['count']))
+        self.assertEqual(counts, {
+            'al-Dānī': 3, 'ʾAbū': 3, 'Bakr': 2, 'b.': 1, 'Muǧāhid': 1,
+            'ʿUmar': 1, 'al-Dūrī': 1, 'Nāfiʿ': 1,
+        })
+        self.assertEqual(list(result['count']), sorted(result['count'], reverse=True))
+
+    def test_streamed_dicts_match_in_memory(self):
+        """Test that chunked processing produces the same dictionaries."""
+        unique_file = self.processor.create_unique_values_dict(self.columns)
+        annotate_file = self.processor.create_annotation_dict(self.columns)
+        expected_unique = pd.read_csv(unique_file)
+        expected_annotate = pd.read_csv(annotate_file, keep_default_na=False)
+
+        unique_file = self.processor.stream_unique_values_dict(self.columns, chunksize=2)
+        annotate_file = self.processor.stream_annotation_dict(self.columns, chunksize=2)
+        pd.testing.assert_frame_equal(pd.read_csv(unique_file), expected_unique)
+        annotate = pd.read_csv(annotate_file, keep_default_na=False)
+        self.assertEqual(dict(zip(annotate['unique_strings'], annotate['count'])),
+                         dict(zip(expected_annotate['unique_strings'], expected_annotate['count'])))
+
+    @unittest.skipUnless(HAS_PYARROW, "requires pyarrow")
+    def test_arrow_annotation_dict_matches_python(self):
+        """Test that PyArrow tokenization counts the same words as the pandas path."""
+        processor = CSVDictionaryProcessor(fast_io=False, prefer_parquet=False)
+        processor.input_file = self.input_file
+        processor.filename_base = os.path.join(self.tmp_dir, "python")
+        self.assertTrue(processor.load_csv(skip_display=True))
+        processor.data = processor.data.astype(object)
+        self.assertFalse(processor._is_arrow_backed(self.columns))
+        expected = pd.read_csv(processor.create_annotation_dict(self.columns), keep_default_na=False)
+
+        result = pd.read_csv(processor.create_annotation_dict_arrow(self.columns), keep_default_na=False)
+        pd.testing.assert_frame_equal(result, expected)
+
+    @unittest.skipUnless(HAS_PYARROW, "requires pyarrow")
+    def test_to_arrow_strings(self):
+        """Test that converting object columns to Arrow strings keeps the dictionaries."""
+        self.processor.data = self.processor.data.astype(object)
+        expected_unique = pd.read_csv(self.processor.create_unique_values_dict(self.columns))
+        expected_annotate = pd.read_csv(self.processor.create_annotation_dict(self.columns), keep_default_na=False)
+
+        self.processor.to_arrow_strings(self.columns)
+        self.assertTrue(self.processor._is_arrow_backed(self.columns))
+        pd.testing.assert_frame_equal(pd.read_csv(self.processor.create_unique_values_dict(self.columns)),
+                                      expected_unique)
+        pd.testing.assert_frame_equal(pd.read_csv(self.processor.create_annotation_dict(self.columns),
+                                                  keep_default_na=False), expected_annotate)
+
+    def test_load_columns_of_interest(self):
+        """Test that only the requested columns are loaded."""
+        self.assertEqual(self.processor.read_columns(), ['path_id', 't0', 't-1', 't-2'])
+        self.assertTrue(self.processor.load_csv(skip_display=True, columns_of_interest=['t0', 't-1']))
+        self.assertEqual(list(self.processor.data.columns), ['t0', 't-1'])
+
+    @unittest.skipUnless(HAS_PYARROW, "requires pyarrow")
+    def test_parquet_copy(self):
+        """Test that a Parquet copy is written and can be used as input."""
+        self.processor.prefer_parquet = True
+        output_file = self.processor.create_unique_values_dict(self.columns)
+        parquet_file = os.path.splitext(output_file)[0] + '.parquet'
+        self.assertTrue(os.path.exists(parquet_file))
+
+        processor = CSVDictionaryProcessor()
+        processor.input_file = parquet_file
+        self.assertFalse(processor.is_large_file())
+        self.assertTrue(processor.load_csv(skip_display=True))
+        pd.testing.assert_frame_equal(processor.data, pd.read_parquet(parquet_file))
+
+    @unittest.skipUnless(HAS_PYARROW, "requires pyarrow")
+    def test_parquet_input_is_opt_in(self):
+        """Test that a Parquet file next to the input CSV is only read if preferred."""
+        parquet_file = os.path.join(self.tmp_dir, "names.parquet")
+        pd.DataFrame({'t0': ['other']}).to_parquet(parquet_file, index=False)
+
+        processor = CSVDictionaryProcessor()
+        processor.input_file = self.input_file
+        self.assertTrue(processor.load_csv(skip_display=True))
+        self.assertEqual(list(processor.data.columns), ['path_id', 't0', 't-1', 't-2'])
+
+        processor = CSVDictionaryProcessor(prefer_parquet=True)
+        processor.input_file = self.input_file
+        with self.assertLogs('csv_processor', level='WARNING') as logs:
+            self.assertTrue(processor.load_csv(skip_display=True))
+        self.assertIn(parquet_file, logs.output[0])
+        self.assertEqual(list(processor.data['t0']), ['other'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the network generation module.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from collections import Counter
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from isnad2network import generate_json_network_isnad
+from isnad2network.generate_json_network_isnad import (
+    IsnadAnalyzer, TransmissionTerm, build_network, compare_chain_lengths, generate_network_data,
+    process_isnad_network
+)
+
+
+class TestIsnadAnalyzer(unittest.TestCase):
+    """Test the classification of transmission cells."""
+
+    def setUp(self):
+        """Create a small transmission terms dataframe."""
+        self.trans_df = pd.DataFrame({
+            'path_id': ['p1', 'p2', 'p3'],
+            'isnad_id': ['i1', 'i2', 'i3'],
+            't0': ['حدثنا', 'قرأت عن', None],
+            't-1': ['تلا', '', ' , '],
+            't-2': ['qaraʾa', 'قرأت عن', 'حدثنا'],
+        })
+
+    def test_analyze_all_cells(self):
+        """Test that every non-empty cell is classified like a single TransmissionTerm."""
+        analyzer = IsnadAnalyzer(self.trans_df, pd.DataFrame())
+        analyzer.analyze_all_cells()
+
+        self.assertEqual(analyzer.cells_with_value_count, 7)
+        self.assertEqual(analyzer.unique_terms, {'حدثنا', 'قرأت عن', 'تلا', 'qaraʾa', ','})
+        self.assertEqual(analyzer.mixed_mode_cells, [
+            {"path_id": 'p2', "column": 't0', "value": 'قرأت عن'},
+            {"path_id": 'p2', "column": 't-2', "value": 'قرأت عن'},
+        ])
+
+        for (path_id, col), term in analyzer.cell_analyses.items():
+            value = self.trans_df.loc[self.trans_df['path_id'] == path_id, col].iloc[0]
+            self.assertEqual(term.to_dict(), TransmissionTerm(value).to_dict())
+
+        matrix = analyzer.classification_matrix.fillna('')
+        self.assertEqual(list(matrix.iloc[0]), ['riwayah', 'tilawah', 'other'])
+        self.assertEqual(list(matrix.iloc[1]), ['mixed', '', 'mixed'])
+        self.assertEqual(list(matrix.iloc[2]), ['', 'unknown', 'riwayah'])
+
+
+class TestBuildNetwork(unittest.TestCase):
+    """Test network generation from the names dataframe."""
+
+    def test_matches_generate_network_data(self):
+        """Test that build_network finds the same nodes, edges and paths."""
+        names_df = pd.DataFrame({
+            'path_id': ['p1', 'p2', 'p3'],
+            't0': ['A', 'A', None],
+            't-1': ['B', '', 'B'],
+            't-2': ['C', 'B', 'C'],
+        })
+        columns = ['t0', 't-1', 't-2']
+        isnad_data = {"paths": [
+            {
+                "path_id": row['path_id'],
+                "names": {col: row[col] for col in columns if pd.notna(row[col]) and row[col] != ""},
+                "term_analysis": {"t-1": TransmissionTerm("حدثنا").to_dict()},
+                "metadata": {},
+            }
+            for _, row in names_df.iterrows()
+        ]}
+
+        expected = generate_network_data(isnad_data)
+        result = build_network(isnad_data, names_df, columns)
+        expected["metadata"].pop("generated")
+        result["metadata"].pop("generated")
+        self.assertEqual(result, expected)
+        self.assertEqual(result["metadata"]["edge_count"], 2)
+
+
+class TestNetworkStream(unittest.TestCase):
+    """Test that streamed network files match the files written in one piece."""
+
+    CASES = {
+        "empty": [],
+        "no edges": [{"path_id": "p1", "names": {"t0": "A"}, "term_analysis": {}, "metadata": {}}],
+        "non-ASCII": [
+            {"path_id": "p1", "isnad_id": "i1", "names": {"t0": "al-Dānī", "t-1": "ʾAbū Bakr", "t-2": "نافع"},
+             "term_analysis": {"t-1": TransmissionTerm("حدثنا").to_dict()}, "metadata": {"Reader": "Nāfiʿ"}},
+            {"path_id": "p2", "isnad_id": "i2", "names": {"t0": "al-Dānī", "t-1": "نافع"},
+             "term_analysis": {"t0": TransmissionTerm("قرأت").to_dict()}, "metadata": {}},
+        ],
+    }
+
+    def setUp(self):
+        """Create a temporary output directory."""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.tmp_dir)
+
+    def _load(self, path):
+        """Load a network file without its generation time."""
+        with open(path, encoding='utf-8') as f:
+            network = json.load(f)
+        network["metadata"].pop("generated")
+        return network
+
+    def test_stream_matches_write_json(self):
+        """Test both JSON encoders with empty, edgeless and non-ASCII networks."""
+        for encoder in ("orjson", "json"):
+            for name, paths in self.CASES.items():
+                with self.subTest(encoder=encoder, case=name), \
+                        mock.patch.object(generate_json_network_isnad, "orjson",
+                                          None if encoder == "json" else generate_json_network_isnad.orjson):
+                    whole_file = os.path.join(self.tmp_dir, "whole.json")
+                    stream_file = os.path.join(self.tmp_dir, "stream.json")
+                    expected = generate_network_data({"paths": paths}, whole_file)
+                    generate_network_data({"paths": paths}, stream_file, stream=True)
+
+                    expected["metadata"].pop("generated")
+                    self.assertEqual(self._load(whole_file), expected)
+                    self.assertEqual(self._load(stream_file), expected)
+
+    def test_failed_stream_leaves_no_partial_file(self):
+        """Test that a failed streamed write keeps the earlier file and removes the partial one."""
+        stream_file = os.path.join(self.tmp_dir, "stream.json")
+        paths = self.CASES["non-ASCII"]
+        generate_network_data({"paths": paths}, stream_file, stream=True)
+        expected = self._load(stream_file)
+
+        # The last path's metadata cannot be serialized, so the write fails after the edges
+        broken = paths + [{"path_id": "p3", "names": {"t0": "X"}, "term_analysis": {},
+                           "metadata": {"Reader": object()}}]
+        with self.assertRaises(TypeError):
+            generate_network_data({"paths": broken}, stream_file, stream=True)
+        self.assertEqual(self._load(stream_file), expected)
+        self.assertEqual(os.listdir(self.tmp_dir), ["stream.json"])
+
+
+class TestCompareChainLengths(unittest.TestCase):
+    """Test the chain length mismatch report."""
+
+    def setUp(self):
+        """Create a temporary output directory."""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.tmp_dir)
+
+    def test_mismatches(self):
+        """Test that the first row of each shared path_id is compared."""
+        names_df = pd.DataFrame({
+            'path_id': ['p1', 'p2', 'p2', 'p3'],
+            't0': ['A', 'A', 'A', 'A'],
+            't-1': ['B', '', 'B', 'B'],
+        })
+        trans_df = pd.DataFrame({
+            'path_id': ['p2', 'p1', 'p4'],
+            't0': ['حدثنا', 'حدثنا', 'حدثنا'],
+            't-1': ['أخبرنا', None, None],
+        })
+
+        result = compare_chain_lengths(names_df, trans_df, self.tmp_dir, sync_io=True)
+        self.assertEqual(result.values.tolist(), [['p1', 2, 1, 1], ['p2', 1, 2, -1]])
+        report = pd.read_csv(os.path.join(self.tmp_dir, "chain_length_mismatches.csv"))
+        self.assertEqual(report.values.tolist(), result.values.tolist())
+
+    def test_background_report(self):
+        """Test that the background thread writes the mismatches as returned."""
+        names_df = pd.DataFrame({'path_id': ['p1'], 't0': ['A'], 't-1': ['B']})
+        trans_df = pd.DataFrame({'path_id': ['p1'], 't0': ['حدثنا'], 't-1': [None]})
+
+        threads = []
+        thread_cls = generate_json_network_isnad.threading.Thread
+
+        def start_thread(*args, **kwargs):
+            threads.append(thread_cls(*args, **kwargs))
+            return threads[-1]
+
+        with mock.patch.object(generate_json_network_isnad.threading, 'Thread', side_effect=start_thread):
+            result = compare_chain_lengths(names_df, trans_df, self.tmp_dir)
+        expected = result.values.tolist()
+        # Changing the result must not change the report
+        result['names_length'] = 0
+        self.assertEqual(len(threads), 1)
+        self.assertFalse(threads[0].daemon)
+        threads[0].join()
+        report = pd.read_csv(os.path.join(self.tmp_dir, "chain_length_mismatches.csv"))
+        self.assertEqual(report.values.tolist(), expected)
+
+
+
+class TestProcessIsnadNetwork(unittest.TestCase):
+    """Test the complete network generation from input files."""
+
+    def setUp(self):
+        """Create a temporary directory for the input and output files."""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.tmp_dir)
+
+    def test_date_metadata(self):
+        """Test that date-like metadata values are written as in the file."""
+        columns = {'path_id': ['p1', 'p2'], 'isnad_id': ['i1', 'i2']}
+        files = {
+            'trans': pd.DataFrame({**columns, 't0': ['حدثنا', 'قرأت'], 't-1': ['عن', 'تلا']}),
+            'names': pd.DataFrame({**columns, 't0': ['A', 'C'], 't-1': ['B', 'B']}),
+            'metadata': pd.DataFrame({**columns, 'date': ['2020-01-01 10:00:00', '2021-02-03 04:05:06'],
+                                      'day': ['2020-01-01', '2021-02-03']}),
+        }
+        paths = {}
+        for name, df in files.items():
+            paths[name] = os.path.join(self.tmp_dir, f"{name}.csv")
+            df.to_csv(paths[name], index=False)
+
+        result = process_isnad_network(paths['trans'], paths['names'], paths['metadata'],
+                                       output_dir=os.path.join(self.tmp_dir, "network"))
+        self.assertEqual(result["status"], "success", result.get("error"))
+
+        with open(result["output_files"]["isnad_data"], encoding='utf-8') as f:
+            isnad_data = json.load(f)
+        self.assertEqual([path["metadata"] for path in isnad_data["paths"]], [
+            {'isnad_id': 'i1', 'date': '2020-01-01 10:00:00', 'day': '2020-01-01'},
+            {'isnad_id': 'i2', 'date': '2021-02-03 04:05:06', 'day': '2021-02-03'},
+        ])
+
+    def test_statistics_with_missing_path_ids(self):
+        """Test that the classification statistics count the cells kept in cell_analyses."""
+        path_ids = [1.0, np.nan, np.nan, 1.0]
+        trans_df = pd.DataFrame({'path_id': path_ids, 't0': ['حدثنا', 'قرأت', 'حدثنا', 'قرأت'],
+                                 't-1': ['عن', 'تلا', None, 'حدثنا']})
+        names_df = pd.DataFrame({'path_id': path_ids, 't0': list('ABCD'), 't-1': list('EFGH')})
+
+        result = process_isnad_network(trans_df=trans_df, names_df=names_df, output_dir=self.tmp_dir,
+                                       skip_filtering=True)
+        self.assertEqual(result["status"], "success", result.get("error"))
+        with open(result["output_files"]["isnad_data"], encoding='utf-8') as f:
+            statistics = json.load(f)["term_statistics"]["by_classification"]
+
+        analyzer = IsnadAnalyzer(trans_df, names_df)
+        analyzer.analyze_all_cells()
+        expected = Counter(term.primary_classification for term in analyzer.cell_analyses.values())
+        self.assertEqual(statistics, dict(expected))
+
+    def test_network_write_error(self):
+        """Test that a failure writing the network file is reported as an error."""
+        columns = {'path_id': ['p1'], 'isnad_id': ['i1']}
+        with mock.patch.object(generate_json_network_isnad, "_write_network_stream",
+                               side_effect=OSError("No space left on device")):
+            result = process_isnad_network(trans_df=pd.DataFrame({**columns, 't0': ['حدثنا'], 't-1': ['عن']}),
+                                           names_df=pd.DataFrame({**columns, 't0': ['A'], 't-1': ['B']}),
+                                           output_dir=self.tmp_dir)
+        self.assertEqual(result["status"], "error")
+        self.assertIn("No space left on device", result["error"])
+
+    def test_data_fixtures(self):
+        """Test that the streamed network of the sample data matches the in-memory one."""
+        data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "data")
+        result = process_isnad_network(os.path.join(data_dir, "transmissionterms.csv"),
+                                       os.path.join(data_dir, "names.csv"),
+                                       os.path.join(data_dir, "pathmetadata.csv"),
+                                       output_dir=os.path.join(self.tmp_dir, "network"))
+        self.assertEqual(result["status"], "success", result.get("error"))
+
+        with open(result["output_files"]["isnad_data"], encoding='utf-8') as f:
+            isnad_data = json.load(f)
+        with open(result["output_files"]["network_graph"], encoding='utf-8') as f:
+            network = json.load(f)
+
+        expected = generate_network_data(isnad_data)
+        self.assertEqual(network["nodes"], expected["nodes"])
+        self.assertEqual(network["edges"], expected["edges"])
+        self.assertEqual(network["paths"], expected["paths"])
+        self.assertEqual(network["metadata"]["edge_count"], result["edge_count"])
+        self.assertEqual(len(network["nodes"]), result["node_count"])
+        self.assertIn("al-Dānī", {node["name"] for node in network["nodes"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the name replacement module.
+"""
+
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+
+from isnad2network.match_replace_isnads import NetworkNameProcessor
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "data")
+
+# PyArrow is an optional dependency (the "fast" extra), needed for the Parquet copy
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+class TestNetworkNameProcessor(unittest.TestCase):
+    """Test name replacement on the sample data."""
+
+    def setUp(self):
+        """Work in a temporary directory, where unmatched names would be saved."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmp_dir)
+
+    def tearDown(self):
+        """Return to the original directory and remove the temporary one."""
+        os.chdir(self.cwd)
+        shutil.rmtree(self.tmp_dir)
+
+    def _run(self, output_file, chunksize=0):
+        """Replace the names of the sample data, in chunks if chunksize is given."""
+        processor = NetworkNameProcessor(os.path.join(DATA_DIR, "names.csv"),
+                                         os.path.join(DATA_DIR, "nodelist.csv"),
+                                         output_file, prefer_parquet=True)
+        self.assertTrue(processor.process_chunked(chunksize) if chunksize else processor.process())
+        with open(output_file, encoding='utf-8') as f:
+            return f.read(), processor.stats
+
+    def test_chunked_matches_process(self):
+        """Test that processing in chunks replaces the same names as process()."""
+        expected = self._run("whole.csv")
+        self.assertGreater(expected[1]['replaced_names'], 0)
+        if HAS_PYARROW:
+            self.assertTrue(os.path.exists("whole.parquet"))
+
+        # A Parquet copy from an earlier run must not outlive the chunked output
+        open("chunked.parquet", "wb").close()
+        for chunksize in (7, 100, 1000):
+            with self.subTest(chunksize=chunksize):
+                self.assertEqual(self._run("chunked.csv", chunksize), expected)
+                self.assertFalse(os.path.exists("chunked.parquet"))
+
+
+if __name__ == "__main__":
+    unittest.main()